@@ -24,11 +24,13 @@ typedef struct {
     int piece_moved[MAX_PIECES];
     int alive[MAX_PIECES];
     int board[8][8];
+    uint64_t occupancy[2];
     int en_passant_target_col;
     int en_passant_target_row;
     int en_passant_capture_col;
     int en_passant_capture_row;
     int halfmove_clock;
+    uint64_t piece_hash; /* XOR of zobrist_piece_key() over live pieces, kept by apply_move */
 } SearchState;
 
 typedef struct {
@@ -60,8 +62,16 @@ typedef struct {
     double control_weight;
     double opposite_bishop_draw_factor;
     int has_opposite_bishop_draw_factor;
+    double square_weights[2][64]; /* [is_rook][row * 8 + col] */
 } EvalParams;
 
+/* What a cached score means once alpha-beta cut the search short. */
+enum {
+    BOUND_EXACT = 0,
+    BOUND_LOWER = 1, /* true score >= stored score (beta cutoff) */
+    BOUND_UPPER = 2, /* true score <= stored score (no move beat alpha) */
+};
+
 typedef struct {
     uint64_t key;
     int remaining_plies;
@@ -69,6 +79,7 @@ typedef struct {
     double material;
     double heuristic;
     uint8_t valid;
+    uint8_t bound;
 } CacheEntry;
 
 typedef struct {
@@ -76,10 +87,133 @@ typedef struct {
     CacheEntry* entries;
 } SearchCache;
 
+/* Diagonal rays come first (RAY_BISHOP_FIRST), then orthogonal ones (RAY_ROOK_FIRST). */
+enum {
+    RAY_BISHOP_FIRST = 0,
+    RAY_ROOK_FIRST = 4,
+    RAY_COUNT = 8,
+};
+static const int ray_dirs[RAY_COUNT][2] = {
+    {-1, -1}, {-1, 1}, {1, -1}, {1, 1},
+    {-1, 0}, {1, 0}, {0, -1}, {0, 1},
+};
+static uint64_t ray_masks[RAY_COUNT][64];
+static int ray_masks_ready = 0;
+
 static int is_inside(int col, int row) {
     return col >= 0 && col < 8 && row >= 0 && row < 8;
 }
 
+static uint64_t square_bit(int col, int row) {
+    return 1ULL << (row * 8 + col);
+}
+
+static void init_ray_masks(void) {
+    if (ray_masks_ready) {
+        return;
+    }
+    for (int dir = 0; dir < RAY_COUNT; dir++) {
+        for (int square = 0; square < 64; square++) {
+            uint64_t mask = 0;
+            int to_col = (square % 8) + ray_dirs[dir][0];
+            int to_row = (square / 8) + ray_dirs[dir][1];
+            while (is_inside(to_col, to_row)) {
+                mask |= square_bit(to_col, to_row);
+                to_col += ray_dirs[dir][0];
+                to_row += ray_dirs[dir][1];
+            }
+            ray_masks[dir][square] = mask;
+        }
+    }
+    ray_masks_ready = 1;
+}
+
+/* Knight and king targets per square, kept in the generator's original offset order. */
+static const int knight_offsets[8][2] = {
+    {-2, -1}, {-2, 1}, {-1, -2}, {-1, 2},
+    {1, -2}, {1, 2}, {2, -1}, {2, 1},
+};
+static const int king_offsets[8][2] = {
+    {-1, -1}, {-1, 0}, {-1, 1}, {0, -1},
+    {0, 1}, {1, -1}, {1, 0}, {1, 1},
+};
+static unsigned char knight_targets[64][8];
+static int knight_target_count[64];
+static unsigned char king_targets[64][8];
+static int king_target_count[64];
+static int step_targets_ready = 0;
+
+static void init_step_target_table(const int offsets[8][2], unsigned char targets[64][8], int target_count[64]) {
+    for (int square = 0; square < 64; square++) {
+        int count = 0;
+        for (int i = 0; i < 8; i++) {
+            int to_col = (square % 8) + offsets[i][0];
+            int to_row = (square / 8) + offsets[i][1];
+            if (is_inside(to_col, to_row)) {
+                targets[square][count++] = (unsigned char)(to_row * 8 + to_col);
+            }
+        }
+        target_count[square] = count;
+    }
+}
+
+static void init_step_targets(void) {
+    if (step_targets_ready) {
+        return;
+    }
+    init_step_target_table(knight_offsets, knight_targets, knight_target_count);
+    init_step_target_table(king_offsets, king_targets, king_target_count);
+    step_targets_ready = 1;
+}
+
+/* Zobrist keys per (moved flag, color, piece type, square), filled from a fixed seed. */
+static uint64_t zobrist_keys[2][2][6][64];
+static int zobrist_keys_ready = 0;
+
+static uint64_t splitmix64(uint64_t* seed) {
+    uint64_t z = (*seed += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+static void init_zobrist_keys(void) {
+    if (zobrist_keys_ready) {
+        return;
+    }
+    uint64_t seed = 0x5eed5eed5eed5eedULL;
+    for (int moved = 0; moved < 2; moved++) {
+        for (int color = 0; color < 2; color++) {
+            for (int piece_type = PIECE_PAWN; piece_type <= PIECE_KING; piece_type++) {
+                for (int square = 0; square < 64; square++) {
+                    zobrist_keys[moved][color][piece_type][square] = splitmix64(&seed);
+                }
+            }
+        }
+    }
+    zobrist_keys_ready = 1;
+}
+
+static uint64_t zobrist_piece_key(const SearchState* state, int piece_index) {
+    return zobrist_keys[state->piece_moved[piece_index] ? 1 : 0][state->piece_color[piece_index]]
+        [state->piece_type[piece_index]][state->piece_row[piece_index] * 8 + state->piece_col[piece_index]];
+}
+
+/* Rays towards higher square indices find their first blocker with the lowest set bit. */
+static int ray_is_ascending(int dir) {
+    return ray_dirs[dir][1] * 8 + ray_dirs[dir][0] > 0;
+}
+
+static uint64_t ray_attacks(int dir, int square, uint64_t occupied) {
+    uint64_t attacks = ray_masks[dir][square];
+    uint64_t blockers = attacks & occupied;
+    if (blockers) {
+        int blocker = ray_is_ascending(dir) ? __builtin_ctzll(blockers) : 63 - __builtin_clzll(blockers);
+        attacks ^= ray_masks[dir][blocker];
+    }
+    return attacks;
+}
+
 static int opponent_color(int color) {
     return color == 0 ? 1 : 0;
 }
@@ -130,6 +264,23 @@ static double square_weight_for_piece(int piece_type, int col, int row, const do
     return 1.0;
 }
 
+static void init_square_weights(EvalParams* params) {
+    for (int square = 0; square < 64; square++) {
+        int col = square % 8;
+        int row = square / 8;
+        params->square_weights[0][square] = square_weight_for_piece(
+            PIECE_PAWN, col, row, params->position_multipliers, params->has_position_multipliers
+        );
+        params->square_weights[1][square] = square_weight_for_piece(
+            PIECE_ROOK, col, row, params->position_multipliers, params->has_position_multipliers
+        );
+    }
+}
+
+static double params_square_weight(const EvalParams* params, int piece_type, int col, int row) {
+    return params->square_weights[piece_type == PIECE_ROOK][row * 8 + col];
+}
+
 static int compare_score(Score a, Score b) {
     if (a.material < b.material) {
         return -1;
@@ -186,7 +337,13 @@ static int init_state(
         return 0;
     }
 
+    init_ray_masks();
+    init_step_targets();
+    init_zobrist_keys();
     state->piece_count = piece_count;
+    state->occupancy[0] = 0;
+    state->occupancy[1] = 0;
+    state->piece_hash = 0;
     clear_board(state);
 
     for (int i = 0; i < piece_count; i++) {
@@ -215,6 +372,8 @@ static int init_state(
         state->piece_moved[i] = piece_moved != NULL ? piece_moved[i] : 0;
         state->alive[i] = 1;
         state->board[row][col] = i;
+        state->occupancy[piece_color] |= square_bit(col, row);
+        state->piece_hash ^= zobrist_piece_key(state, i);
     }
 
     state->en_passant_target_col = en_passant_target_col;
@@ -241,6 +400,22 @@ static int append_move(MoveList* list, int from_col, int from_row, int to_col, i
     return 1;
 }
 
+static void append_ray_moves(MoveList* list, int col, int row, uint64_t targets, int ascending) {
+    if (ascending) {
+        while (targets) {
+            int square = __builtin_ctzll(targets);
+            append_move(list, col, row, square & 7, square >> 3, -1);
+            targets &= targets - 1;
+        }
+        return;
+    }
+    while (targets) {
+        int square = 63 - __builtin_clzll(targets);
+        append_move(list, col, row, square & 7, square >> 3, -1);
+        targets ^= 1ULL << square;
+    }
+}
+
 static void generate_moves_for_piece(const SearchState* state, int piece_index, MoveList* list) {
     if (!state->alive[piece_index]) {
         return;
@@ -300,89 +475,36 @@ static void generate_moves_for_piece(const SearchState* state, int piece_index,
         return;
     }
 
-    if (piece_type == PIECE_KNIGHT) {
-        static const int offsets[8][2] = {
-            {-2, -1}, {-2, 1}, {-1, -2}, {-1, 2},
-            {1, -2}, {1, 2}, {2, -1}, {2, 1},
-        };
-        for (int i = 0; i < 8; i++) {
-            int to_col = col + offsets[i][0];
-            int to_row = row + offsets[i][1];
-            if (!is_inside(to_col, to_row)) {
-                continue;
-            }
-            int target_index = state->board[to_row][to_col];
-            if (target_index == -1 || state->piece_color[target_index] != piece_color) {
-                append_move(list, col, row, to_col, to_row, -1);
+    if (piece_type == PIECE_KNIGHT || piece_type == PIECE_KING) {
+        int square = row * 8 + col;
+        const unsigned char* targets = piece_type == PIECE_KNIGHT ? knight_targets[square] : king_targets[square];
+        int target_count = piece_type == PIECE_KNIGHT ? knight_target_count[square] : king_target_count[square];
+        uint64_t own = state->occupancy[piece_color];
+        for (int i = 0; i < target_count; i++) {
+            int target = targets[i];
+            if (!(own & (1ULL << target))) {
+                append_move(list, col, row, target & 7, target >> 3, -1);
             }
         }
-        return;
+        if (piece_type == PIECE_KNIGHT) {
+            return;
+        }
     }
 
     if (piece_type == PIECE_BISHOP || piece_type == PIECE_ROOK || piece_type == PIECE_QUEEN) {
-        static const int bishop_dirs[4][2] = {{-1, -1}, {-1, 1}, {1, -1}, {1, 1}};
-        static const int rook_dirs[4][2] = {{-1, 0}, {1, 0}, {0, -1}, {0, 1}};
-
-        if (piece_type == PIECE_BISHOP || piece_type == PIECE_QUEEN) {
-            for (int i = 0; i < 4; i++) {
-                int to_col = col + bishop_dirs[i][0];
-                int to_row = row + bishop_dirs[i][1];
-                while (is_inside(to_col, to_row)) {
-                    int target_index = state->board[to_row][to_col];
-                    if (target_index == -1) {
-                        append_move(list, col, row, to_col, to_row, -1);
-                    } else {
-                        if (state->piece_color[target_index] != piece_color) {
-                            append_move(list, col, row, to_col, to_row, -1);
-                        }
-                        break;
-                    }
-                    to_col += bishop_dirs[i][0];
-                    to_row += bishop_dirs[i][1];
-                }
-            }
-        }
-
-        if (piece_type == PIECE_ROOK || piece_type == PIECE_QUEEN) {
-            for (int i = 0; i < 4; i++) {
-                int to_col = col + rook_dirs[i][0];
-                int to_row = row + rook_dirs[i][1];
-                while (is_inside(to_col, to_row)) {
-                    int target_index = state->board[to_row][to_col];
-                    if (target_index == -1) {
-                        append_move(list, col, row, to_col, to_row, -1);
-                    } else {
-                        if (state->piece_color[target_index] != piece_color) {
-                            append_move(list, col, row, to_col, to_row, -1);
-                        }
-                        break;
-                    }
-                    to_col += rook_dirs[i][0];
-                    to_row += rook_dirs[i][1];
-                }
-            }
+        int square = row * 8 + col;
+        uint64_t occupied = state->occupancy[0] | state->occupancy[1];
+        uint64_t own = state->occupancy[piece_color];
+        int first_dir = piece_type == PIECE_ROOK ? RAY_ROOK_FIRST : RAY_BISHOP_FIRST;
+        int last_dir = piece_type == PIECE_BISHOP ? RAY_ROOK_FIRST : RAY_COUNT;
+        for (int dir = first_dir; dir < last_dir; dir++) {
+            uint64_t targets = ray_attacks(dir, square, occupied) & ~own;
+            append_ray_moves(list, col, row, targets, ray_is_ascending(dir));
         }
         return;
     }
 
     if (piece_type == PIECE_KING) {
-        for (int d_col = -1; d_col <= 1; d_col++) {
-            for (int d_row = -1; d_row <= 1; d_row++) {
-                if (d_col == 0 && d_row == 0) {
-                    continue;
-                }
-                int to_col = col + d_col;
-                int to_row = row + d_row;
-                if (!is_inside(to_col, to_row)) {
-                    continue;
-                }
-                int target_index = state->board[to_row][to_col];
-                if (target_index == -1 || state->piece_color[target_index] != piece_color) {
-                    append_move(list, col, row, to_col, to_row, -1);
-                }
-            }
-        }
-
         if (!state->piece_moved[piece_index]) {
             int home_row = piece_color == 0 ? 0 : 7;
             if (col == 4 && row == home_row) {
@@ -427,6 +549,58 @@ static void generate_legal_moves_for_color(const SearchState* state, int color,
     }
 }
 
+/*
+ * Move ordering for interior nodes: captures first, most valuable victim then least
+ * valuable attacker (MVV-LVA), quiet moves after in generation order. Piece type
+ * indexes already rise with value and the king, whose capture wins, is the largest.
+ */
+static void order_moves(const SearchState* state, MoveList* list) {
+    int keys[MAX_MOVES];
+    for (int i = 0; i < list->count; i++) {
+        const Move* move = &list->entries[i];
+        int victim_index = state->board[move->to_row][move->to_col];
+        if (victim_index == -1) {
+            keys[i] = -1;
+            continue;
+        }
+        int attacker_index = state->board[move->from_row][move->from_col];
+        keys[i] = state->piece_type[victim_index] * 8 + (PIECE_KING - state->piece_type[attacker_index]);
+    }
+
+    /* Stable insertion sort on descending key; lists are short and mostly quiet. */
+    for (int i = 1; i < list->count; i++) {
+        int key = keys[i];
+        if (key < 0) {
+            continue;
+        }
+        Move move = list->entries[i];
+        int j = i - 1;
+        while (j >= 0 && keys[j] < key) {
+            keys[j + 1] = keys[j];
+            list->entries[j + 1] = list->entries[j];
+            j--;
+        }
+        keys[j + 1] = key;
+        list->entries[j + 1] = move;
+    }
+}
+
+/* Existence-only check: stops at the first piece that has any move. */
+static int has_legal_move_state(const SearchState* state, int color) {
+    MoveList scratch;
+    for (int i = 0; i < state->piece_count; i++) {
+        if (!state->alive[i] || state->piece_color[i] != color) {
+            continue;
+        }
+        scratch.count = 0;
+        generate_moves_for_piece(state, i, &scratch);
+        if (scratch.count > 0) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
 static int apply_move(SearchState* state, const Move* move) {
     if (!is_inside(move->from_col, move->from_row) || !is_inside(move->to_col, move->to_row)) {
         return 0;
@@ -463,16 +637,22 @@ static int apply_move(SearchState* state, const Move* move) {
             return 0;
         }
         state->alive[capture_index] = 0;
+        state->piece_hash ^= zobrist_piece_key(state, capture_index);
         state->board[state->en_passant_capture_row][state->en_passant_capture_col] = -1;
+        state->occupancy[state->piece_color[capture_index]] &= ~square_bit(state->en_passant_capture_col, state->en_passant_capture_row);
         is_capture = 1;
     } else if (target_index != -1) {
         if (!state->alive[target_index] || state->piece_color[target_index] == piece_color) {
             return 0;
         }
         state->alive[target_index] = 0;
+        state->piece_hash ^= zobrist_piece_key(state, target_index);
         state->board[move->to_row][move->to_col] = -1;
+        state->occupancy[state->piece_color[target_index]] &= ~square_bit(move->to_col, move->to_row);
     }
 
+    state->piece_hash ^= zobrist_piece_key(state, piece_index);
+    state->occupancy[piece_color] ^= square_bit(move->from_col, move->from_row) | square_bit(move->to_col, move->to_row);
     state->board[move->from_row][move->from_col] = -1;
     state->board[move->to_row][move->to_col] = piece_index;
     state->piece_col[piece_index] = move->to_col;
@@ -487,25 +667,32 @@ static int apply_move(SearchState* state, const Move* move) {
         if (move->to_col > move->from_col) {
             int rook_index = state->board[home_row][7];
             if (rook_index != -1 && state->alive[rook_index] && state->piece_type[rook_index] == PIECE_ROOK) {
+                state->piece_hash ^= zobrist_piece_key(state, rook_index);
                 state->board[home_row][7] = -1;
                 state->board[home_row][5] = rook_index;
+                state->occupancy[piece_color] ^= square_bit(7, home_row) | square_bit(5, home_row);
                 state->piece_col[rook_index] = 5;
                 state->piece_row[rook_index] = home_row;
                 state->piece_moved[rook_index] = 1;
+                state->piece_hash ^= zobrist_piece_key(state, rook_index);
             }
         } else {
             int rook_index = state->board[home_row][0];
             if (rook_index != -1 && state->alive[rook_index] && state->piece_type[rook_index] == PIECE_ROOK) {
+                state->piece_hash ^= zobrist_piece_key(state, rook_index);
                 state->board[home_row][0] = -1;
                 state->board[home_row][3] = rook_index;
+                state->occupancy[piece_color] ^= square_bit(0, home_row) | square_bit(3, home_row);
                 state->piece_col[rook_index] = 3;
                 state->piece_row[rook_index] = home_row;
                 state->piece_moved[rook_index] = 1;
+                state->piece_hash ^= zobrist_piece_key(state, rook_index);
             }
         }
     }
 
     state->piece_moved[piece_index] = 1;
+    state->piece_hash ^= zobrist_piece_key(state, piece_index);
 
     state->en_passant_target_col = -1;
     state->en_passant_target_row = -1;
@@ -631,13 +818,7 @@ static double control_score(const SearchState* state, int perspective_color, con
         double controlled = 0.0;
         int piece_type = state->piece_type[i];
         for (int j = 0; j < moves.count; j++) {
-            controlled += square_weight_for_piece(
-                piece_type,
-                moves.entries[j].to_col,
-                moves.entries[j].to_row,
-                params->position_multipliers,
-                params->has_position_multipliers
-            );
+            controlled += params_square_weight(params, piece_type, moves.entries[j].to_col, moves.entries[j].to_row);
         }
 
         if (state->piece_color[i] == perspective_color) {
@@ -654,6 +835,9 @@ static Score evaluate_state(const SearchState* state, int perspective_color, con
     score.material = 0.0;
     score.heuristic = 0.0;
 
+    /* Material is a dot product of per-type count differences with the piece values. */
+    double type_balance[6] = {0.0, 0.0, 0.0, 0.0, 0.0, 0.0};
+
     for (int i = 0; i < state->piece_count; i++) {
         if (!state->alive[i]) {
             continue;
@@ -680,24 +864,22 @@ static Score evaluate_state(const SearchState* state, int perspective_color, con
             }
         }
 
-        piece_score *= square_weight_for_piece(
-            piece_type,
-            piece_col,
-            piece_row,
-            params->position_multipliers,
-            params->has_position_multipliers
-        );
+        piece_score *= params_square_weight(params, piece_type, piece_col, piece_row);
         double heuristic_score = piece_score - material_score;
 
         if (piece_color == perspective_color) {
-            score.material += material_score;
+            type_balance[piece_type] += 1.0;
             score.heuristic += heuristic_score;
         } else {
-            score.material -= material_score;
+            type_balance[piece_type] -= 1.0;
             score.heuristic -= heuristic_score;
         }
     }
 
+    for (int piece_type = PIECE_PAWN; piece_type <= PIECE_KING; piece_type++) {
+        score.material += type_balance[piece_type] * params->piece_values[piece_type];
+    }
+
     if (params->control_weight != 0.0) {
         score.heuristic += params->control_weight * control_score(state, perspective_color, params);
     }
@@ -715,23 +897,8 @@ static uint64_t hash_mix(uint64_t hash, uint64_t value) {
 }
 
 static uint64_t hash_state(const SearchState* state, int active_color, int remaining_plies) {
-    uint64_t hash = 1469598103934665603ULL;
-    for (int row = 0; row < 8; row++) {
-        for (int col = 0; col < 8; col++) {
-            int piece_index = state->board[row][col];
-            if (piece_index == -1 || !state->alive[piece_index]) {
-                hash = hash_mix(hash, 0ULL);
-                continue;
-            }
-            uint64_t piece_bits = (uint64_t)state->piece_type[piece_index]
-                | ((uint64_t)state->piece_color[piece_index] << 3)
-                | ((uint64_t)(state->piece_moved[piece_index] ? 1 : 0) << 4)
-                | ((uint64_t)col << 8)
-                | ((uint64_t)row << 16);
-            hash = hash_mix(hash, piece_bits + 1ULL);
-        }
-    }
-
+    /* Piece placement is hashed incrementally; only the few scalar fields are mixed in here. */
+    uint64_t hash = state->piece_hash;
     uint64_t en_passant_bits = (uint64_t)(state->en_passant_target_col + 1)
         | ((uint64_t)(state->en_passant_target_row + 1) << 4)
         | ((uint64_t)(state->en_passant_capture_col + 1) << 8)
@@ -743,11 +910,14 @@ static uint64_t hash_state(const SearchState* state, int active_color, int remai
     return hash;
 }
 
+/* Returns 1 when the stored entry settles this node for the window [alpha, beta]. */
 static int cache_lookup(
     const SearchCache* cache,
     uint64_t key,
     int active_color,
     int remaining_plies,
+    Score alpha,
+    Score beta,
     Score* out_score
 ) {
     if (cache == NULL || cache->entries == NULL || cache->capacity == 0) {
@@ -765,9 +935,18 @@ static int cache_lookup(
         return 0;
     }
 
-    out_score->material = entry->material;
-    out_score->heuristic = entry->heuristic;
-    return 1;
+    Score stored;
+    stored.material = entry->material;
+    stored.heuristic = entry->heuristic;
+    if (
+        entry->bound == BOUND_EXACT
+        || (entry->bound == BOUND_LOWER && compare_score(stored, beta) >= 0)
+        || (entry->bound == BOUND_UPPER && compare_score(stored, alpha) <= 0)
+    ) {
+        *out_score = stored;
+        return 1;
+    }
+    return 0;
 }
 
 static void cache_store(
@@ -775,7 +954,8 @@ static void cache_store(
     uint64_t key,
     int active_color,
     int remaining_plies,
-    Score score
+    Score score,
+    int bound
 ) {
     if (cache == NULL || cache->entries == NULL || cache->capacity == 0) {
         return;
@@ -789,6 +969,7 @@ static void cache_store(
     entry->remaining_plies = remaining_plies;
     entry->material = score.material;
     entry->heuristic = score.heuristic;
+    entry->bound = (uint8_t)bound;
 }
 
 void* create_search_cache_c(size_t max_bytes) {
@@ -838,7 +1019,8 @@ enum {
     STATUS_WIN = 2,
 };
 
-static int get_game_status_state(const SearchState* state, int active_color, int* winner) {
+/* legal_moves may hold the side's already generated moves; NULL falls back to has_legal_move_state. */
+static int get_game_status_state(const SearchState* state, int active_color, const MoveList* legal_moves, int* winner) {
     int white_king_found = 0;
     int black_king_found = 0;
     for (int i = 0; i < state->piece_count; i++) {
@@ -870,9 +1052,8 @@ static int get_game_status_state(const SearchState* state, int active_color, int
         return STATUS_DRAW;
     }
 
-    MoveList legal_moves;
-    generate_legal_moves_for_color(state, active_color, &legal_moves);
-    if (legal_moves.count == 0) {
+    int has_moves = legal_moves != NULL ? legal_moves->count > 0 : has_legal_move_state(state, active_color);
+    if (!has_moves) {
         *winner = -1;
         return STATUS_DRAW;
     }
@@ -881,82 +1062,169 @@ static int get_game_status_state(const SearchState* state, int active_color, int
     return STATUS_IN_PROGRESS;
 }
 
+/*
+ * Fail-soft alpha-beta over the same minimax as before. Scores outside (alpha, beta)
+ * are only bounds, but they never beat the caller's best move, so the chosen move is
+ * the one plain minimax would pick.
+ */
 static Score minimax_score_state(
     const SearchState* state,
     int active_color,
     int perspective_color,
     int remaining_plies,
+    Score alpha,
+    Score beta,
     const EvalParams* params,
     SearchCache* cache
 ) {
-    uint64_t key = hash_state(state, active_color, remaining_plies);
+    uint64_t key = cache != NULL ? hash_state(state, active_color, remaining_plies) : 0;
     Score cached_score;
-    if (cache_lookup(cache, key, active_color, remaining_plies, &cached_score)) {
+    if (cache_lookup(cache, key, active_color, remaining_plies, alpha, beta, &cached_score)) {
         return cached_score;
     }
 
+    /* Interior nodes need the full move list anyway, so generate it once and let the
+       status check reuse it; leaves only need to know whether any move exists. */
+    MoveList legal_moves;
+    if (remaining_plies > 0) {
+        generate_legal_moves_for_color(state, active_color, &legal_moves);
+    }
+
     int winner = -1;
-    int state_status = get_game_status_state(state, active_color, &winner);
+    int state_status = get_game_status_state(
+        state,
+        active_color,
+        remaining_plies > 0 ? &legal_moves : NULL,
+        &winner
+    );
     if (state_status == STATUS_WIN) {
         Score score = score_for_winner(winner, perspective_color);
-        cache_store(cache, key, active_color, remaining_plies, score);
+        cache_store(cache, key, active_color, remaining_plies, score, BOUND_EXACT);
         return score;
     }
     if (state_status == STATUS_DRAW) {
         Score score = draw_score();
-        cache_store(cache, key, active_color, remaining_plies, score);
+        cache_store(cache, key, active_color, remaining_plies, score, BOUND_EXACT);
         return score;
     }
     if (remaining_plies <= 0) {
         Score score = evaluate_state(state, perspective_color, params);
-        cache_store(cache, key, active_color, remaining_plies, score);
-        return score;
-    }
-
-    MoveList legal_moves;
-    generate_legal_moves_for_color(state, active_color, &legal_moves);
-    if (legal_moves.count == 0) {
-        Score score = draw_score();
-        cache_store(cache, key, active_color, remaining_plies, score);
+        cache_store(cache, key, active_color, remaining_plies, score, BOUND_EXACT);
         return score;
     }
 
+    order_moves(state, &legal_moves);
+    Score original_alpha = alpha;
+    Score original_beta = beta;
     int next_color = opponent_color(active_color);
-    if (active_color == perspective_color) {
-        Score best;
-        best.material = -1e300;
-        best.heuristic = -1e300;
-        for (int i = 0; i < legal_moves.count; i++) {
-            SearchState child = *state;
-            if (!apply_move(&child, &legal_moves.entries[i])) {
-                continue;
-            }
-            Score current = minimax_score_state(&child, next_color, perspective_color, remaining_plies - 1, params, cache);
-            if (compare_score(current, best) > 0) {
-                best = current;
-            }
-        }
-        cache_store(cache, key, active_color, remaining_plies, best);
-        return best;
-    }
-
+    int maximizing = active_color == perspective_color;
     Score best;
-    best.material = 1e300;
-    best.heuristic = 1e300;
+    best.material = maximizing ? -1e300 : 1e300;
+    best.heuristic = best.material;
     for (int i = 0; i < legal_moves.count; i++) {
         SearchState child = *state;
         if (!apply_move(&child, &legal_moves.entries[i])) {
             continue;
         }
-        Score current = minimax_score_state(&child, next_color, perspective_color, remaining_plies - 1, params, cache);
-        if (compare_score(current, best) < 0) {
+        Score current = minimax_score_state(
+            &child,
+            next_color,
+            perspective_color,
+            remaining_plies - 1,
+            alpha,
+            beta,
+            params,
+            cache
+        );
+        if (maximizing) {
+            if (compare_score(current, best) > 0) {
+                best = current;
+                if (compare_score(best, alpha) > 0) {
+                    alpha = best;
+                }
+            }
+        } else if (compare_score(current, best) < 0) {
             best = current;
+            if (compare_score(best, beta) < 0) {
+                beta = best;
+            }
+        }
+        if (compare_score(alpha, beta) >= 0) {
+            break;
         }
     }
-    cache_store(cache, key, active_color, remaining_plies, best);
+
+    int bound = BOUND_EXACT;
+    if (compare_score(best, original_alpha) <= 0) {
+        bound = BOUND_UPPER;
+    } else if (compare_score(best, original_beta) >= 0) {
+        bound = BOUND_LOWER;
+    }
+    cache_store(cache, key, active_color, remaining_plies, best, bound);
     return best;
 }
 
+static void init_eval_params(
+    EvalParams* params,
+    const double* piece_values,
+    const double* pawn_rank_values,
+    int has_pawn_rank_values,
+    double backward_pawn_value,
+    int has_backward_pawn_value,
+    const double* position_multipliers,
+    int has_position_multipliers,
+    double control_weight,
+    double opposite_bishop_draw_factor,
+    int has_opposite_bishop_draw_factor
+) {
+    params->piece_values = piece_values;
+    params->pawn_rank_values = pawn_rank_values;
+    params->has_pawn_rank_values = has_pawn_rank_values;
+    params->backward_pawn_value = backward_pawn_value;
+    params->has_backward_pawn_value = has_backward_pawn_value;
+    params->position_multipliers = position_multipliers;
+    params->has_position_multipliers = has_position_multipliers;
+    params->control_weight = control_weight;
+    params->opposite_bishop_draw_factor = opposite_bishop_draw_factor;
+    params->has_opposite_bishop_draw_factor = has_opposite_bishop_draw_factor;
+    init_square_weights(params);
+}
+
+static int evaluate_components_with_params(
+    const int* piece_types,
+    const int* piece_colors,
+    const int* piece_cols,
+    const int* piece_rows,
+    int piece_count,
+    int perspective_color,
+    const EvalParams* params,
+    double* out_material,
+    double* out_heuristic
+) {
+    SearchState state;
+    if (!init_state(
+        &state,
+        piece_types,
+        piece_colors,
+        piece_cols,
+        piece_rows,
+        NULL,
+        piece_count,
+        -1,
+        -1,
+        -1,
+        -1,
+        0
+    )) {
+        return 0;
+    }
+
+    Score score = evaluate_state(&state, perspective_color, params);
+    *out_material = score.material;
+    *out_heuristic = score.heuristic;
+    return 1;
+}
+
 int evaluate_piece_components_c(
     const int* piece_types,
     const int* piece_colors,
@@ -986,39 +1254,99 @@ int evaluate_piece_components_c(
         return 0;
     }
 
-    SearchState state;
-    if (!init_state(
-        &state,
+    EvalParams params;
+    init_eval_params(
+        &params,
+        piece_values,
+        pawn_rank_values,
+        has_pawn_rank_values,
+        backward_pawn_value,
+        has_backward_pawn_value,
+        position_multipliers,
+        has_position_multipliers,
+        0.0,
+        1.0,
+        0
+    );
+
+    return evaluate_components_with_params(
         piece_types,
         piece_colors,
         piece_cols,
         piece_rows,
-        NULL,
         piece_count,
-        -1,
-        -1,
-        -1,
-        -1,
-        0
-    )) {
+        perspective_color,
+        &params,
+        out_material,
+        out_heuristic
+    );
+}
+
+int evaluate_piece_components_batch_c(
+    const int* piece_types,
+    const int* piece_colors,
+    const int* piece_cols,
+    const int* piece_rows,
+    const int* position_offsets,
+    int position_count,
+    int perspective_color,
+    const double* piece_values,
+    const double* pawn_rank_values,
+    int has_pawn_rank_values,
+    double backward_pawn_value,
+    int has_backward_pawn_value,
+    const double* position_multipliers,
+    int has_position_multipliers,
+    double* out_material,
+    double* out_heuristic
+) {
+    if (
+        piece_types == NULL
+        || piece_colors == NULL
+        || piece_cols == NULL
+        || piece_rows == NULL
+        || position_offsets == NULL
+        || piece_values == NULL
+        || out_material == NULL
+        || out_heuristic == NULL
+        || position_count < 0
+    ) {
         return 0;
     }
 
+    /* Parameters and square weights are shared by every position in the batch. */
     EvalParams params;
-    params.piece_values = piece_values;
-    params.pawn_rank_values = pawn_rank_values;
-    params.has_pawn_rank_values = has_pawn_rank_values;
-    params.backward_pawn_value = backward_pawn_value;
-    params.has_backward_pawn_value = has_backward_pawn_value;
-    params.position_multipliers = position_multipliers;
-    params.has_position_multipliers = has_position_multipliers;
-    params.control_weight = 0.0;
-    params.opposite_bishop_draw_factor = 1.0;
-    params.has_opposite_bishop_draw_factor = 0;
-
-    Score score = evaluate_state(&state, perspective_color, &params);
-    *out_material = score.material;
-    *out_heuristic = score.heuristic;
+    init_eval_params(
+        &params,
+        piece_values,
+        pawn_rank_values,
+        has_pawn_rank_values,
+        backward_pawn_value,
+        has_backward_pawn_value,
+        position_multipliers,
+        has_position_multipliers,
+        0.0,
+        1.0,
+        0
+    );
+
+    for (int i = 0; i < position_count; i++) {
+        int start = position_offsets[i];
+        int piece_count = position_offsets[i + 1] - start;
+        if (!evaluate_components_with_params(
+            piece_types + start,
+            piece_colors + start,
+            piece_cols + start,
+            piece_rows + start,
+            piece_count,
+            perspective_color,
+            &params,
+            &out_material[i],
+            &out_heuristic[i]
+        )) {
+            return 0;
+        }
+    }
     return 1;
 }
 
@@ -1098,21 +1426,27 @@ int choose_best_move_c(
     }
 
     EvalParams params;
-    params.piece_values = piece_values;
-    params.pawn_rank_values = pawn_rank_values;
-    params.has_pawn_rank_values = has_pawn_rank_values;
-    params.backward_pawn_value = backward_pawn_value;
-    params.has_backward_pawn_value = has_backward_pawn_value;
-    params.position_multipliers = position_multipliers;
-    params.has_position_multipliers = has_position_multipliers;
-    params.control_weight = control_weight;
-    params.opposite_bishop_draw_factor = opposite_bishop_draw_factor;
-    params.has_opposite_bishop_draw_factor = has_opposite_bishop_draw_factor;
+    init_eval_params(
+        &params,
+        piece_values,
+        pawn_rank_values,
+        has_pawn_rank_values,
+        backward_pawn_value,
+        has_backward_pawn_value,
+        position_multipliers,
+        has_position_multipliers,
+        control_weight,
+        opposite_bishop_draw_factor,
+        has_opposite_bishop_draw_factor
+    );
 
     int next_color = opponent_color(active_color);
     Score best_score;
     best_score.material = -1e300;
     best_score.heuristic = -1e300;
+    Score no_upper_bound;
+    no_upper_bound.material = 1e300;
+    no_upper_bound.heuristic = 1e300;
     int best_index = 0;
 
     for (int i = 0; i < legal_moves.count; i++) {
@@ -1120,7 +1454,18 @@ int choose_best_move_c(
         if (!apply_move(&child, &legal_moves.entries[i])) {
             continue;
         }
-        Score score = minimax_score_state(&child, next_color, active_color, plies - 1, &params, cache);
+        /* Only a strictly better move replaces the best, so each child is searched
+           with the best score so far as alpha. */
+        Score score = minimax_score_state(
+            &child,
+            next_color,
+            active_color,
+            plies - 1,
+            best_score,
+            no_upper_bound,
+            &params,
+            cache
+        );
         if (compare_score(score, best_score) > 0) {
             best_score = score;
             best_index = i;
@@ -3,8 +3,10 @@ import random
 import time
 
 from chess import (
+    _build_c_eval_arrays,
     _evaluate_position_scores_c_base,
     _evaluate_position_scores_python_base,
+    _evaluate_positions_scores_c_batch,
     c_evaluator_available,
     get_ai_profiles,
     get_game_status,
@@ -19,67 +21,120 @@ def parse_args():
     parser.add_argument("--max-plies", type=int, default=18, help="Max random plies when generating each position")
     parser.add_argument("--seed", type=int, default=7, help="RNG seed")
     parser.add_argument("--profile-id", default="d2_pawnwise_control", help="AI profile id for eval settings")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Memoize scores by board placement across iterations (measures cache-hit throughput)",
+    )
     return parser.parse_args()
 
 
 def _sample_positions(count, max_plies, rng):
+    # Bound once: the walk below is the hottest pure-Python loop in the benchmark.
+    randint = rng.randint
+    randrange = rng.randrange
+    next_turn = {"white": "black", "black": "white"}
     positions = []
     for _ in range(count):
         board = Board()
+        legal_moves_for_color = board.get_legal_moves_for_color
+        move_piece = board.move_piece
         current_turn = "white"
-        plies = rng.randint(0, max_plies)
 
-        for _ in range(plies):
-            if get_game_status(board, current_turn)["state"] != "in_progress":
-                break
-            legal_moves = board.get_legal_moves_for_color(current_turn)
-            if not legal_moves:
+        for _ in range(randint(0, max_plies)):
+            legal_moves = legal_moves_for_color(current_turn)
+            if get_game_status(board, current_turn, legal_moves=legal_moves)["state"] != "in_progress":
                 break
-            from_pos, to_pos = rng.choice(legal_moves)
-            board.move_piece(from_pos, to_pos)
-            current_turn = board.get_opponent_color(current_turn)
+            # Same RNG stream as rng.choice, without the sequence-protocol round trip.
+            from_pos, to_pos = legal_moves[randrange(len(legal_moves))]
+            move_piece(from_pos, to_pos)
+            current_turn = next_turn[current_turn]
 
         positions.append(board)
     return positions
 
 
 def _evaluate_python(positions, perspective_color, profile):
-    total = 0.0
+    piece_values = profile["piece_values"]
+    pawn_rank_values = profile.get("pawn_rank_values")
+    backward_pawn_value = profile.get("backward_pawn_value")
+    position_multipliers = profile.get("position_multipliers")
+    scores = []
     for board in positions:
         material_score, heuristic_score = _evaluate_position_scores_python_base(
             board,
             perspective_color,
-            profile["piece_values"],
-            pawn_rank_values=profile.get("pawn_rank_values"),
-            backward_pawn_value=profile.get("backward_pawn_value"),
-            position_multipliers=profile.get("position_multipliers"),
+            piece_values,
+            pawn_rank_values=pawn_rank_values,
+            backward_pawn_value=backward_pawn_value,
+            position_multipliers=position_multipliers,
         )
-        total += material_score + heuristic_score
-    return total
+        scores.append(material_score + heuristic_score)
+    return scores
+
+
+def _profile_eval_arrays(profile):
+    return _build_c_eval_arrays(
+        profile["piece_values"],
+        pawn_rank_values=profile.get("pawn_rank_values"),
+        backward_pawn_value=profile.get("backward_pawn_value"),
+        position_multipliers=profile.get("position_multipliers"),
+    )
 
 
-def _evaluate_c(positions, perspective_color, profile):
-    total = 0.0
+def _evaluate_c(positions, perspective_color, profile, eval_arrays=None):
+    piece_values = profile["piece_values"]
+    if eval_arrays is None:
+        eval_arrays = _profile_eval_arrays(profile)
+    scores = []
     for board in positions:
-        scores = _evaluate_position_scores_c_base(
+        position_scores = _evaluate_position_scores_c_base(
             board,
             perspective_color,
-            profile["piece_values"],
-            pawn_rank_values=profile.get("pawn_rank_values"),
-            backward_pawn_value=profile.get("backward_pawn_value"),
-            position_multipliers=profile.get("position_multipliers"),
+            piece_values,
+            eval_arrays=eval_arrays,
         )
-        if scores is None:
+        if position_scores is None:
             raise RuntimeError("C evaluator unavailable during benchmark")
-        total += scores[0] + scores[1]
-    return total
+        scores.append(position_scores[0] + position_scores[1])
+    return scores
+
+
+def _evaluate_c_batch(positions, perspective_color, profile, eval_arrays=None):
+    if eval_arrays is None:
+        eval_arrays = _profile_eval_arrays(profile)
+    scores = _evaluate_positions_scores_c_batch(
+        positions,
+        perspective_color,
+        profile["piece_values"],
+        eval_arrays=eval_arrays,
+    )
+    return [material_score + heuristic_score for material_score, heuristic_score in scores]
+
+
+def _with_eval_cache(func):
+    cache = {}
+
+    def evaluate(positions, perspective_color, profile):
+        # Misses go to the wrapped evaluator in one call, so c-batch still measures a
+        # single batched foreign call per pass rather than one per position.
+        keys = [(perspective_color, board.get_placement_key()) for board in positions]
+        misses = {}
+        for key, board in zip(keys, positions):
+            if key not in cache and key not in misses:
+                misses[key] = board
+        if misses:
+            cache.update(zip(misses, func(list(misses.values()), perspective_color, profile)))
+        return [cache[key] for key in keys]
+
+    return evaluate
 
 
 def _benchmark(label, func, positions, perspective_color, profile, iterations):
     start = time.perf_counter()
     checksum = 0.0
     for _ in range(iterations):
-        checksum += func(positions, perspective_color, profile)
+        checksum += sum(func(positions, perspective_color, profile))
     elapsed = time.perf_counter() - start
     calls = len(positions) * iterations
     per_call_us = (elapsed / calls) * 1_000_000.0
@@ -96,15 +151,16 @@ def main():
         raise ValueError(f"Unknown profile id: {args.profile_id}")
 
     perspective_color = "white"
+    wrap = _with_eval_cache if args.cache else (lambda func: func)
     positions = _sample_positions(args.positions, args.max_plies, rng)
     print(
         f"Generated {len(positions)} positions, iterations={args.iterations}, "
-        f"profile={profile['id']}, seed={args.seed}"
+        f"profile={profile['id']}, seed={args.seed}, cache={args.cache}"
     )
 
     python_elapsed, python_checksum = _benchmark(
         "python",
-        _evaluate_python,
+        wrap(_evaluate_python),
         positions,
         perspective_color,
         profile,
@@ -115,9 +171,21 @@ def main():
         print("C evaluator unavailable (gcc/build/load failed), skipping C benchmark")
         return
 
+    # The profile is fixed for the run, so its C arrays are built once, not per pass.
+    eval_arrays = _profile_eval_arrays(profile)
+
     c_elapsed, c_checksum = _benchmark(
         "c",
-        _evaluate_c,
+        wrap(lambda batch, color, batch_profile: _evaluate_c(batch, color, batch_profile, eval_arrays)),
+        positions,
+        perspective_color,
+        profile,
+        args.iterations,
+    )
+
+    c_batch_elapsed, c_batch_checksum = _benchmark(
+        "c-batch",
+        wrap(lambda batch, color, batch_profile: _evaluate_c_batch(batch, color, batch_profile, eval_arrays)),
         positions,
         perspective_color,
         profile,
@@ -126,8 +194,12 @@ def main():
 
     delta = abs(c_checksum - python_checksum)
     speedup = python_elapsed / c_elapsed if c_elapsed > 0 else float("inf")
+    batch_delta = abs(c_batch_checksum - python_checksum)
+    batch_speedup = python_elapsed / c_batch_elapsed if c_batch_elapsed > 0 else float("inf")
     print(f"checksum delta: {delta:.10f}")
     print(f"speedup: {speedup:.2f}x")
+    print(f"batch checksum delta: {batch_delta:.10f}")
+    print(f"batch speedup: {batch_speedup:.2f}x")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 import re
 from datetime import datetime
 import os
-import copy
 import random
 import ctypes
 
@@ -17,6 +16,11 @@ PIECE_TYPE_BY_CLASS = {
 }
 PIECE_ORDER = ["pawn", "knight", "bishop", "rook", "queen", "king"]
 PIECE_INDEX_BY_TYPE = {piece_type: index for index, piece_type in enumerate(PIECE_ORDER)}
+COLOR_INDEX_BY_NAME = {"white": 0, "black": 1}
+COLOR_NAMES = ("white", "black")
+SQUARE_POSITIONS = tuple((square % 8, square // 8) for square in range(64))
+KNIGHT_OFFSETS = ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))
+KING_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
 C_EVAL_SOURCE = os.path.join(os.path.dirname(__file__), "ai_eval.c")
 C_EVAL_LIBRARY = os.path.join(os.path.dirname(__file__), "ai_eval.so")
 C_SEARCH_CACHE_MAX_BYTES = 1024 * 1024 * 1024
@@ -24,6 +28,7 @@ _C_EVAL_FUNCTION = None
 _C_EVAL_ATTEMPTED = False
 _C_EVAL_LIBRARY_HANDLE = None
 _C_SEARCH_FUNCTION = None
+_C_EVAL_BATCH_FUNCTION = None
 _C_CREATE_SEARCH_CACHE_FUNCTION = None
 _C_DESTROY_SEARCH_CACHE_FUNCTION = None
 
@@ -238,20 +243,284 @@ RANDOM_AI_PROFILE = {
 }
 
 
+# Square names indexed by row * 8 + col, and the reverse map back to (col, row).
+SQUARE_NAMES = tuple(file_char + rank_char for rank_char in "12345678" for file_char in "abcdefgh")
+POSITIONS_BY_SQUARE_NAME = {name: (square % 8, square // 8) for square, name in enumerate(SQUARE_NAMES)}
+
+
 def square_to_position(square):
-    if len(square) != 2:
-        raise ValueError(f"Invalid square: {square}")
-    file_char, rank_char = square[0], square[1]
-    if file_char not in "abcdefgh" or rank_char not in "12345678":
-        raise ValueError(f"Invalid square: {square}")
-    return ord(file_char) - ord("a"), int(rank_char) - 1
+    try:
+        return POSITIONS_BY_SQUARE_NAME[square]
+    except KeyError:
+        raise ValueError(f"Invalid square: {square}") from None
 
 
 def position_to_square(position):
     col, row = position
     if not (0 <= col < 8 and 0 <= row < 8):
         raise ValueError(f"Invalid position: {position}")
-    return f"{chr(ord('a') + col)}{row + 1}"
+    return SQUARE_NAMES[row * 8 + col]
+
+
+def position_to_index(position):
+    col, row = position
+    return row * 8 + col
+
+
+LIGHT_SQUARES = sum(1 << square for square, (col, row) in enumerate(SQUARE_POSITIONS) if (col + row) % 2)
+FILE_MASKS = tuple(0x0101010101010101 << col for col in range(8))
+RANK_MASKS = tuple(0xFF << (row * 8) for row in range(8))
+
+# RANK_BYTE_POSITIONS[row][byte] lists the (col, row) squares set in one rank's 8 bits.
+RANK_BYTE_POSITIONS = tuple(
+    tuple(tuple((col, row) for col in range(8) if rank_bits >> col & 1) for rank_bits in range(256))
+    for row in range(8)
+)
+
+
+def bitboard_to_positions(bitboard):
+    # A table hit per occupied rank is cheaper in CPython than one bit scan per set bit.
+    positions = []
+    row = 0
+    while bitboard:
+        rank_bits = bitboard & 0xFF
+        if rank_bits:
+            positions.extend(RANK_BYTE_POSITIONS[row][rank_bits])
+        bitboard >>= 8
+        row += 1
+    return positions
+
+
+def _build_step_attacks(offsets):
+    attacks = []
+    for col, row in SQUARE_POSITIONS:
+        attack_mask = 0
+        for col_offset, row_offset in offsets:
+            target_col = col + col_offset
+            target_row = row + row_offset
+            if 0 <= target_col < 8 and 0 <= target_row < 8:
+                attack_mask |= 1 << (target_row * 8 + target_col)
+        attacks.append(attack_mask)
+    return tuple(attacks)
+
+
+def _build_step_target_positions(offsets):
+    # Every subset of a square's step targets maps to those targets as positions in
+    # offset order, so masking the attack table keeps the per-offset move order.
+    tables = []
+    for col, row in SQUARE_POSITIONS:
+        targets = [
+            (1 << ((row + row_offset) * 8 + col + col_offset), (col + col_offset, row + row_offset))
+            for col_offset, row_offset in offsets
+            if 0 <= col + col_offset < 8 and 0 <= row + row_offset < 8
+        ]
+        attack_mask = sum(bit for bit, _ in targets)
+        table = {}
+        subset = 0
+        while True:
+            table[subset] = tuple(position for bit, position in targets if subset & bit)
+            subset = (subset - attack_mask) & attack_mask
+            if subset == 0:
+                break
+        tables.append(table)
+    return tuple(tables)
+
+
+def _ray_attacks(position, directions, occupied):
+    col, row = position
+    attack_mask = 0
+    for col_step, row_step in directions:
+        current_col = col + col_step
+        current_row = row + row_step
+        while 0 <= current_col < 8 and 0 <= current_row < 8:
+            square_bit = 1 << (current_row * 8 + current_col)
+            attack_mask |= square_bit
+            if occupied & square_bit:
+                break
+            current_col += col_step
+            current_row += row_step
+    return attack_mask
+
+
+def _relevant_occupancy_mask(position, directions):
+    # Edge squares never block anything further along the ray, so they are left out.
+    col, row = position
+    occupancy_mask = 0
+    for col_step, row_step in directions:
+        current_col = col + col_step
+        current_row = row + row_step
+        while 0 <= current_col + col_step < 8 and 0 <= current_row + row_step < 8:
+            occupancy_mask |= 1 << (current_row * 8 + current_col)
+            current_col += col_step
+            current_row += row_step
+    return occupancy_mask
+
+
+def _build_slider_attack_tables(directions):
+    masks = []
+    tables = []
+    for position in SQUARE_POSITIONS:
+        occupancy_mask = _relevant_occupancy_mask(position, directions)
+        table = {}
+        subset = 0
+        while True:
+            table[subset] = _ray_attacks(position, directions, subset)
+            subset = (subset - occupancy_mask) & occupancy_mask
+            if subset == 0:
+                break
+        masks.append(occupancy_mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+
+KNIGHT_ATTACKS = _build_step_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = _build_step_attacks(KING_OFFSETS)
+KNIGHT_TARGET_POSITIONS = _build_step_target_positions(KNIGHT_OFFSETS)
+KING_TARGET_POSITIONS = _build_step_target_positions(KING_OFFSETS)
+# Squares attacked by a pawn of each color (white, black) standing on a square.
+PAWN_ATTACKS = (
+    _build_step_attacks(((-1, 1), (1, 1))),
+    _build_step_attacks(((-1, -1), (1, -1))),
+)
+
+
+def _build_pawn_push_squares(direction, start_row):
+    pushes = []
+    for col, row in SQUARE_POSITIONS:
+        single_row = row + direction
+        single_square = single_row * 8 + col if 0 <= single_row < 8 else None
+        double_square = (row + 2 * direction) * 8 + col if row == start_row else None
+        pushes.append((single_square, double_square))
+    return tuple(pushes)
+
+
+# (one-step, two-step) push target squares per color and square, None where unavailable.
+PAWN_PUSH_SQUARES = (_build_pawn_push_squares(1, 1), _build_pawn_push_squares(-1, 6))
+
+
+def _build_castle_rules(home_row):
+    # (rook square, squares that must be empty, king destination), kingside first.
+    return (
+        (home_row * 8 + 7, (1 << (home_row * 8 + 5)) | (1 << (home_row * 8 + 6)), (6, home_row)),
+        (
+            home_row * 8,
+            (1 << (home_row * 8 + 1)) | (1 << (home_row * 8 + 2)) | (1 << (home_row * 8 + 3)),
+            (2, home_row),
+        ),
+    )
+
+
+# King home square and castle rules for each color (white, black).
+CASTLE_RULES = ((4, _build_castle_rules(0)), (60, _build_castle_rules(7)))
+
+
+def _build_pawn_support_masks(color_index):
+    masks = []
+    for col, row in SQUARE_POSITIONS:
+        support_rows = range(row, 8) if color_index == 0 else range(0, row + 1)
+        support_mask = 0
+        for adjacent_col in (col - 1, col + 1):
+            if 0 <= adjacent_col < 8:
+                for support_row in support_rows:
+                    support_mask |= 1 << (support_row * 8 + adjacent_col)
+        masks.append(support_mask)
+    return tuple(masks)
+
+
+# Adjacent-file squares level with or ahead of a pawn, per color; a friendly pawn
+# there means the pawn is not backward.
+PAWN_SUPPORT_MASKS = (_build_pawn_support_masks(0), _build_pawn_support_masks(1))
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+ROOK_OCCUPANCY_MASKS, ROOK_ATTACK_TABLES = _build_slider_attack_tables(ROOK_DIRECTIONS)
+BISHOP_OCCUPANCY_MASKS, BISHOP_ATTACK_TABLES = _build_slider_attack_tables(BISHOP_DIRECTIONS)
+
+
+def _build_ray_target_positions(directions):
+    # Per square, (ray mask, {reachable bits: positions}) for each non-empty ray in
+    # direction order. Slider attacks minus own pieces always cover a nearest-first
+    # prefix of each ray, so one dict hit per ray restores the original walk order.
+    tables = []
+    for col, row in SQUARE_POSITIONS:
+        rays = []
+        for col_step, row_step in directions:
+            ray_mask = 0
+            prefixes = {}
+            positions = []
+            target_col, target_row = col + col_step, row + row_step
+            while 0 <= target_col < 8 and 0 <= target_row < 8:
+                ray_mask |= 1 << (target_row * 8 + target_col)
+                positions.append((target_col, target_row))
+                prefixes[ray_mask] = tuple(positions)
+                target_col += col_step
+                target_row += row_step
+            if ray_mask:
+                rays.append((ray_mask, prefixes))
+        tables.append(tuple(rays))
+    return tuple(tables)
+
+
+def ray_targets_to_positions(rays, targets):
+    moves = []
+    for ray_mask, prefixes in rays:
+        ray_targets = targets & ray_mask
+        if ray_targets:
+            moves.extend(prefixes[ray_targets])
+    return moves
+
+
+ROOK_RAY_POSITIONS = _build_ray_target_positions(ROOK_DIRECTIONS)
+BISHOP_RAY_POSITIONS = _build_ray_target_positions(BISHOP_DIRECTIONS)
+QUEEN_RAY_POSITIONS = tuple(
+    rook_rays + bishop_rays for rook_rays, bishop_rays in zip(ROOK_RAY_POSITIONS, BISHOP_RAY_POSITIONS)
+)
+
+
+def rook_attacks(square, occupied):
+    return ROOK_ATTACK_TABLES[square][occupied & ROOK_OCCUPANCY_MASKS[square]]
+
+
+def bishop_attacks(square, occupied):
+    return BISHOP_ATTACK_TABLES[square][occupied & BISHOP_OCCUPANCY_MASKS[square]]
+
+
+def queen_attacks(square, occupied):
+    return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+
+
+# Attack functions for bishop, rook and queen, indexed by Piece.type_index.
+SLIDER_ATTACKS_BY_TYPE = (None, None, bishop_attacks, rook_attacks, queen_attacks)
+
+
+STARTING_BACK_RANK = ("rook", "knight", "bishop", "queen", "king", "bishop", "knight", "rook")
+STARTING_PIECE_LAYOUT = tuple(
+    (color, piece_type, (col, row))
+    for color, back_row, pawn_row in (("white", 0, 1), ("black", 7, 6))
+    for row, rank_types in ((back_row, STARTING_BACK_RANK), (pawn_row, ("pawn",) * 8))
+    for col, piece_type in enumerate(rank_types)
+)
+
+
+def _build_starting_bitboards():
+    bitboards = [0] * 12
+    occupancy = [0, 0]
+    for color, piece_type, (col, row) in STARTING_PIECE_LAYOUT:
+        color_index = COLOR_INDEX_BY_NAME[color]
+        square_bit = 1 << (row * 8 + col)
+        bitboards[color_index * len(PIECE_ORDER) + PIECE_INDEX_BY_TYPE[piece_type]] |= square_bit
+        occupancy[color_index] |= square_bit
+    return tuple(bitboards), tuple(occupancy)
+
+
+STARTING_BITBOARDS, STARTING_OCCUPANCY = _build_starting_bitboards()
+
+
+# Allowed text after the two squares of a coordinate move -> promotion piece.
+COORDINATE_PROMOTION_SUFFIXES = {
+    "": None,
+    **{letter: letter for letter in "qrbn"},
+    **{"=" + letter: letter for letter in "qrbn"},
+}
 
 
 def parse_coordinate_move(move_text):
@@ -259,20 +528,68 @@ def parse_coordinate_move(move_text):
     if not text:
         raise ValueError("Move cannot be empty")
 
+    # <from><to>[=]<promotion>: two square-name probes and one suffix probe, no regex.
     normalized = text.lower()
-    match = re.match(r"^(?P<from>[a-h][1-8])(?P<to>[a-h][1-8])(?P<promotion>=?[qrbn])?$", normalized)
-    if not match:
+    from_square = normalized[:2]
+    to_square = normalized[2:4]
+    suffix = normalized[4:]
+    if (
+        from_square not in POSITIONS_BY_SQUARE_NAME
+        or to_square not in POSITIONS_BY_SQUARE_NAME
+        or suffix not in COORDINATE_PROMOTION_SUFFIXES
+    ):
         raise ValueError("Invalid move format. Use source and destination, for example: e2e4")
 
-    groups = match.groupdict()
-    promotion = groups["promotion"]
-    promotion_piece = promotion.replace("=", "") if promotion else None
+    promotion_piece = COORDINATE_PROMOTION_SUFFIXES[suffix]
     return {
-        "from_square": groups["from"],
-        "to_square": groups["to"],
+        "from_square": from_square,
+        "to_square": to_square,
         "promotion_piece": promotion_piece,
-        "normalized": f"{groups['from']}{groups['to']}{promotion_piece or ''}",
+        "normalized": f"{from_square}{to_square}{promotion_piece or ''}",
+    }
+
+
+ALGEBRAIC_FILES = "abcdefgh"
+ALGEBRAIC_RANKS = "12345678"
+ALGEBRAIC_PIECE_LETTERS = "KQRBNkqrbn"
+ALGEBRAIC_PROMOTION_LETTERS = "QRBNqrbn"
+
+
+def _scan_algebraic_move(text):
+    # Matches [piece][file][rank][x]<square>[=promotion] without a regex. The square and
+    # promotion are read from the end, so the optional prefix fields can be taken greedily.
+    end = len(text)
+    promotion = None
+    if end and text[-1] in ALGEBRAIC_PROMOTION_LETTERS:
+        end -= 1
+        promotion = text[end]
+        if end and text[end - 1] == "=":
+            end -= 1
+    if end < 2 or text[end - 2] not in ALGEBRAIC_FILES or text[end - 1] not in ALGEBRAIC_RANKS:
+        return None
+
+    groups = {
+        "piece": None,
+        "from_file": None,
+        "from_rank": None,
+        "capture": None,
+        "to": text[end - 2:end],
+        "promotion": promotion,
     }
+    index = 0
+    prefix_end = end - 2
+    for field, allowed in (
+        ("piece", ALGEBRAIC_PIECE_LETTERS),
+        ("from_file", ALGEBRAIC_FILES),
+        ("from_rank", ALGEBRAIC_RANKS),
+        ("capture", "x"),
+    ):
+        if index < prefix_end and text[index] in allowed:
+            groups[field] = text[index]
+            index += 1
+    if index != prefix_end:
+        return None
+    return groups
 
 
 def parse_algebraic_move(move_text):
@@ -280,7 +597,7 @@ def parse_algebraic_move(move_text):
     if not text:
         raise ValueError("Move cannot be empty")
 
-    normalized = re.sub(r"[+#?!]+$", "", text)
+    normalized = text.rstrip("+#?!")
     castle_token = normalized.replace("0", "O").replace("o", "O")
     if castle_token in {"O-O", "O-O-O"}:
         side = "kingside" if castle_token == "O-O" else "queenside"
@@ -290,14 +607,10 @@ def parse_algebraic_move(move_text):
             "normalized": castle_token,
         }
 
-    match = re.match(
-        r"^(?P<piece>[KQRBNkqrbn])?(?P<from_file>[a-h])?(?P<from_rank>[1-8])?(?P<capture>x)?(?P<to>[a-h][1-8])(?P<promotion>=?[QRBNqrbn])?$",
-        normalized,
-    )
-    if not match:
+    groups = _scan_algebraic_move(normalized)
+    if groups is None:
         raise ValueError("Invalid algebraic move format")
 
-    groups = match.groupdict()
     piece_letter = (groups["piece"] or "").upper()
     piece_type = {
         "": "pawn",
@@ -348,11 +661,9 @@ def _piece_letter_for_algebraic(piece):
 
 def _disambiguation_for_piece_move(board, piece, to_position):
     competing_pieces = []
-    for candidate in board.pieces:
+    for candidate in board.pieces_by_color[piece.color_index]:
         if candidate is piece:
             continue
-        if candidate.color != piece.color:
-            continue
         if candidate.__class__ is not piece.__class__:
             continue
         if board.is_legal_move(piece.color, candidate.position, to_position):
@@ -365,7 +676,7 @@ def _disambiguation_for_piece_move(board, piece, to_position):
     shares_file = any(candidate.position[0] == from_col for candidate in competing_pieces)
     shares_rank = any(candidate.position[1] == from_row for candidate in competing_pieces)
 
-    file_text = chr(ord("a") + from_col)
+    file_text = ALGEBRAIC_FILES[from_col]
     rank_text = str(from_row + 1)
 
     if not shares_file:
@@ -409,18 +720,19 @@ def _resolve_algebraic_move_details(board, color, move_text):
         return from_position, to_position, None, parsed_move["normalized"]
 
     to_position = square_to_position(parsed_move["to_square"])
+    # Only squares on the mover's bitboard for this piece type can hold a candidate.
+    candidate_bits = board.bitboards[
+        COLOR_INDEX_BY_NAME[color] * len(PIECE_ORDER) + PIECE_INDEX_BY_TYPE[parsed_move["piece_type"]]
+    ]
+    if parsed_move["from_file"] is not None:
+        candidate_bits &= FILE_MASKS[ord(parsed_move["from_file"]) - ord("a")]
+    if parsed_move["from_rank"] is not None:
+        candidate_bits &= RANK_MASKS[int(parsed_move["from_rank"]) - 1]
+
     candidate_pieces = []
-    for piece in board.pieces:
-        if piece.color != color:
-            continue
-        if not _piece_matches_type(piece, parsed_move["piece_type"]):
-            continue
-        if parsed_move["from_file"] is not None and piece.position[0] != ord(parsed_move["from_file"]) - ord("a"):
-            continue
-        if parsed_move["from_rank"] is not None and piece.position[1] != int(parsed_move["from_rank"]) - 1:
-            continue
-        if board.is_legal_move(color, piece.position, to_position):
-            candidate_pieces.append(piece)
+    for from_position in bitboard_to_positions(candidate_bits):
+        if board.is_legal_move(color, from_position, to_position):
+            candidate_pieces.append(board.get_piece_at(from_position))
 
     if not candidate_pieces:
         raise ValueError("No legal piece can make that algebraic move")
@@ -465,7 +777,7 @@ def move_text_to_algebraic(board, color, move_text):
     destination = position_to_square(to_position)
 
     if isinstance(piece, Pawn):
-        prefix = f"{chr(ord('a') + from_col)}x" if is_capture else ""
+        prefix = f"{ALGEBRAIC_FILES[from_col]}x" if is_capture else ""
         promotion_suffix = ""
         if to_row in (0, 7):
             promotion_suffix = f"={(promotion_choice or 'q').upper()}"
@@ -560,9 +872,8 @@ def _build_c_piece_arrays(board, include_moved=False):
     piece_rows = []
     piece_moved = []
     for piece in board.pieces:
-        piece_type = PIECE_TYPE_BY_CLASS[piece.__class__.__name__]
-        piece_types.append(PIECE_INDEX_BY_TYPE[piece_type])
-        piece_colors.append(0 if piece.color == "white" else 1)
+        piece_types.append(piece.type_index)
+        piece_colors.append(piece.color_index)
         piece_cols.append(piece.position[0])
         piece_rows.append(piece.position[1])
         if include_moved:
@@ -581,6 +892,44 @@ def _build_c_piece_arrays(board, include_moved=False):
     return piece_count, piece_type_array, piece_color_array, piece_col_array, piece_row_array, piece_moved_array
 
 
+def _load_c_eval_batch_function():
+    global _C_EVAL_BATCH_FUNCTION
+
+    if _C_EVAL_BATCH_FUNCTION is not None:
+        return _C_EVAL_BATCH_FUNCTION
+
+    _load_c_eval_function()
+    if _C_EVAL_LIBRARY_HANDLE is None:
+        raise RuntimeError("Required C evaluator library handle was not initialized")
+
+    try:
+        batch_function = _C_EVAL_LIBRARY_HANDLE.evaluate_piece_components_batch_c
+    except AttributeError as error:
+        raise RuntimeError("Required C batch symbol evaluate_piece_components_batch_c is missing") from error
+
+    batch_function.argtypes = [
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.c_int,
+        ctypes.c_double,
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.c_int,
+        ctypes.POINTER(ctypes.c_double),
+        ctypes.POINTER(ctypes.c_double),
+    ]
+    batch_function.restype = ctypes.c_int
+    _C_EVAL_BATCH_FUNCTION = batch_function
+    return _C_EVAL_BATCH_FUNCTION
+
+
 def _build_c_eval_arrays(piece_values, pawn_rank_values=None, backward_pawn_value=None, position_multipliers=None):
     ordered_piece_values = [float(piece_values[piece_type]) for piece_type in PIECE_ORDER]
     piece_value_array = (ctypes.c_double * len(PIECE_ORDER))(*ordered_piece_values)
@@ -822,6 +1171,7 @@ def _evaluate_position_scores_c_base(
     pawn_rank_values=None,
     backward_pawn_value=None,
     position_multipliers=None,
+    eval_arrays=None,
 ):
     evaluate_function = _load_c_eval_function()
 
@@ -829,6 +1179,13 @@ def _evaluate_position_scores_c_base(
         return 0.0, 0.0
 
     piece_count, piece_type_array, piece_color_array, piece_col_array, piece_row_array, _ = _build_c_piece_arrays(board)
+    if eval_arrays is None:
+        eval_arrays = _build_c_eval_arrays(
+            piece_values,
+            pawn_rank_values=pawn_rank_values,
+            backward_pawn_value=backward_pawn_value,
+            position_multipliers=position_multipliers,
+        )
     (
         piece_value_array,
         pawn_rank_array,
@@ -837,12 +1194,7 @@ def _evaluate_position_scores_c_base(
         has_backward_pawn_value,
         position_array,
         has_position_multipliers,
-    ) = _build_c_eval_arrays(
-        piece_values,
-        pawn_rank_values=pawn_rank_values,
-        backward_pawn_value=backward_pawn_value,
-        position_multipliers=position_multipliers,
-    )
+    ) = eval_arrays
 
     material_score = ctypes.c_double()
     heuristic_score = ctypes.c_double()
@@ -870,6 +1222,79 @@ def _evaluate_position_scores_c_base(
     return material_score.value, heuristic_score.value
 
 
+def _evaluate_positions_scores_c_batch(
+    boards,
+    perspective_color,
+    piece_values,
+    pawn_rank_values=None,
+    backward_pawn_value=None,
+    position_multipliers=None,
+    eval_arrays=None,
+):
+    # One foreign call for every board; ctypes drops the GIL for its duration.
+    batch_function = _load_c_eval_batch_function()
+
+    position_count = len(boards)
+    if position_count == 0:
+        return []
+
+    piece_types = []
+    piece_colors = []
+    piece_cols = []
+    piece_rows = []
+    position_offsets = [0]
+    for board in boards:
+        for piece in board.pieces:
+            piece_types.append(piece.type_index)
+            piece_colors.append(piece.color_index)
+            piece_cols.append(piece.position[0])
+            piece_rows.append(piece.position[1])
+        position_offsets.append(len(piece_types))
+
+    piece_count = len(piece_types)
+    if eval_arrays is None:
+        eval_arrays = _build_c_eval_arrays(
+            piece_values,
+            pawn_rank_values=pawn_rank_values,
+            backward_pawn_value=backward_pawn_value,
+            position_multipliers=position_multipliers,
+        )
+    (
+        piece_value_array,
+        pawn_rank_array,
+        has_pawn_rank_values,
+        backward_pawn_entry,
+        has_backward_pawn_value,
+        position_array,
+        has_position_multipliers,
+    ) = eval_arrays
+
+    material_scores = (ctypes.c_double * position_count)()
+    heuristic_scores = (ctypes.c_double * position_count)()
+    success = batch_function(
+        (ctypes.c_int * piece_count)(*piece_types),
+        (ctypes.c_int * piece_count)(*piece_colors),
+        (ctypes.c_int * piece_count)(*piece_cols),
+        (ctypes.c_int * piece_count)(*piece_rows),
+        (ctypes.c_int * (position_count + 1))(*position_offsets),
+        position_count,
+        COLOR_INDEX_BY_NAME[perspective_color],
+        piece_value_array,
+        pawn_rank_array,
+        has_pawn_rank_values,
+        backward_pawn_entry,
+        has_backward_pawn_value,
+        position_array,
+        has_position_multipliers,
+        material_scores,
+        heuristic_scores,
+    )
+    if success != 1:
+        raise RuntimeError("C evaluator failed to score position batch")
+
+    return list(zip(material_scores, heuristic_scores))
+
+
 def _status_to_pgn_result(status):
     if status.get("winner") == "white":
         return "1-0"
@@ -910,14 +1335,19 @@ def _move_to_pgn_fragment(move_number, color, move_text):
 
 
 def start_savefile(savefile_path):
-    has_existing_content = os.path.exists(savefile_path) and os.path.getsize(savefile_path) > 0
+    # Returns the byte offset of this game's header, so finalize_savefile only has to
+    # rewrite the current game rather than the whole file.
+    existing_size = os.path.getsize(savefile_path) if os.path.exists(savefile_path) else 0
     with open(savefile_path, "a", encoding="utf-8") as savefile:
-        if has_existing_content:
+        if existing_size > 0:
             savefile.write("\n")
+        # Read back rather than computed: text mode may write the separator as "\r\n".
+        header_offset = savefile.tell()
         started_at = datetime.now().isoformat(timespec="seconds")
         for header_line in _build_pgn_header_lines(started_at, result="*"):
             savefile.write(f"{header_line}\n")
         savefile.write("\n")
+    return header_offset
 
 
 def record_move(savefile_path, move_number, color, move_text):
@@ -925,24 +1355,21 @@ def record_move(savefile_path, move_number, color, move_text):
         savefile.write(_move_to_pgn_fragment(move_number, color, move_text))
 
 
-def finalize_savefile(savefile_path, status):
+def finalize_savefile(savefile_path, status, header_offset=0):
     result = _status_to_pgn_result(status)
+    pending_tag = b"[Result \"*\"]"
 
-    with open(savefile_path, "r", encoding="utf-8") as savefile:
-        content = savefile.read()
-
-    last_result_tag_index = content.rfind("[Result \"*\"]")
-    if last_result_tag_index >= 0:
-        content = (
-            content[:last_result_tag_index]
-            + f"[Result \"{result}\"]"
-            + content[last_result_tag_index + len("[Result \"*\"]"):]
-        )
-        with open(savefile_path, "w", encoding="utf-8") as savefile:
-            savefile.write(content)
-
-    with open(savefile_path, "a", encoding="utf-8") as savefile:
-        savefile.write(f"{result}\n\n")
+    # Everything before header_offset belongs to earlier games and is left in place;
+    # only the tail from the last pending Result tag onwards is rewritten.
+    with open(savefile_path, "rb+") as savefile:
+        savefile.seek(header_offset)
+        game_text = savefile.read()
+        last_result_tag_index = game_text.rfind(pending_tag)
+        if last_result_tag_index >= 0:
+            savefile.seek(header_offset + last_result_tag_index)
+            savefile.write(f"[Result \"{result}\"]".encode("utf-8"))
+            savefile.write(game_text[last_result_tag_index + len(pending_tag):])
+        savefile.write(f"{result}\n\n".encode("utf-8"))
 
 
 class SavefileRecorder:
@@ -951,22 +1378,42 @@ class SavefileRecorder:
         self.move_number = 1
         self.started = False
         self.finalized = False
+        # Append handle held for the whole game, so each move is one write and flush
+        # rather than an open/close round trip.
+        self.savefile = None
+        self.header_offset = 0
 
     def prepare_new_game(self):
+        self.close()
         self.move_number = 1
         self.started = False
         self.finalized = False
 
     def start_new_game(self):
-        start_savefile(self.savefile_path)
+        self.close()
+        self.header_offset = start_savefile(self.savefile_path)
+        self.savefile = open(self.savefile_path, "a", encoding="utf-8")
         self.move_number = 1
         self.started = True
         self.finalized = False
 
+    def __deepcopy__(self, memo):
+        # An open file cannot be copied. The copy shares the savefile path and reopens it
+        # on its next write, so deep-copied boards stay copyable mid-game.
+        clone = object.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.savefile = None
+        memo[id(self)] = clone
+        return clone
+
     def record_algebraic_move(self, color, move_text):
         if not self.started or self.finalized:
             self.start_new_game()
-        record_move(self.savefile_path, self.move_number, color, move_text)
+        if self.savefile is None:
+            self.savefile = open(self.savefile_path, "a", encoding="utf-8")
+        self.savefile.write(_move_to_pgn_fragment(self.move_number, color, move_text))
+        # Flushed per move so an interrupted game still leaves every move on disk.
+        self.savefile.flush()
         self.move_number += 1
 
     def has_moves(self):
@@ -975,9 +1422,15 @@ class SavefileRecorder:
     def finalize(self, status):
         if not self.started or self.finalized:
             return
-        finalize_savefile(self.savefile_path, status)
+        self.close()
+        finalize_savefile(self.savefile_path, status, header_offset=self.header_offset)
         self.finalized = True
 
+    def close(self):
+        if self.savefile is not None:
+            self.savefile.close()
+            self.savefile = None
+
 
 def set_savefile_recorder(board, savefile_recorder):
     board.savefile_recorder = savefile_recorder
@@ -1002,6 +1455,10 @@ def _record_board_move(board, color, normalized_move):
     savefile_recorder.record_algebraic_move(color, algebraic_move)
 
 
+LEGACY_GAME_HEADER_PATTERN = re.compile(r"^=== Game started (?P<started_at>.+) ===$")
+LEGACY_MOVE_PATTERN = re.compile(r"^(?P<move_number>\d+)\.\s+(?P<color>white|black)\s+(?P<move_text>\S+)$")
+
+
 def _parse_legacy_savefile_games(save_text):
     games = []
     current_game = None
@@ -1011,7 +1468,7 @@ def _parse_legacy_savefile_games(save_text):
         if not line:
             continue
 
-        header_match = re.match(r"^=== Game started (?P<started_at>.+) ===$", line)
+        header_match = LEGACY_GAME_HEADER_PATTERN.match(line)
         if header_match:
             if current_game is not None:
                 games.append(current_game)
@@ -1021,7 +1478,7 @@ def _parse_legacy_savefile_games(save_text):
             }
             continue
 
-        move_match = re.match(r"^(?P<move_number>\d+)\.\s+(?P<color>white|black)\s+(?P<move_text>\S+)$", line)
+        move_match = LEGACY_MOVE_PATTERN.match(line)
         if move_match and current_game is not None:
             current_game["moves"].append(
                 {
@@ -1082,144 +1539,127 @@ def convert_legacy_savefile_to_pgn(input_path, output_path=None):
 
 
 class Piece:
+    __slots__ = ("color", "color_index", "bitboard_index", "position", "square", "moved", "symbol")
+    type_index = None
+
     def __init__(self, color, position):
         self.color = color
+        self.color_index = COLOR_INDEX_BY_NAME[color]
+        # Small-int piece code: white pawn..king are 0-5, black pawn..king are 6-11.
+        self.bitboard_index = self.color_index * 6 + self.type_index
         self.position = position
+        # Cached row * 8 + col index into the attack tables; kept in step with position.
+        self.square = position[1] * 8 + position[0]
         self.moved = False
 
+    def copy(self):
+        # Every slot holds an immutable value, so they are shared by reference.
+        clone = object.__new__(self.__class__)
+        clone.color = self.color
+        clone.color_index = self.color_index
+        clone.bitboard_index = self.bitboard_index
+        clone.position = self.position
+        clone.square = self.square
+        clone.moved = self.moved
+        clone.symbol = self.symbol
+        return clone
+
+    def __deepcopy__(self, memo):
+        clone = self.copy()
+        memo[id(self)] = clone
+        return clone
+
     def get_legal_moves(self, board):
         raise NotImplementedError("Subclasses must implement get_legal_moves")
 
+    def get_move_bitboard(self, board):
+        # Same destinations as get_legal_moves as one int, for callers that only test
+        # membership or emptiness and never need the ordered list.
+        raise NotImplementedError("Subclasses must implement get_move_bitboard")
+
     def is_valid_position(self, position):
         col, row = position
         return 0 <= col < 8 and 0 <= row < 8
 
     def can_occupy(self, board, position):
         target_piece = board.get_piece_at(position)
-        return target_piece is None or target_piece.color != self.color
-
-    def is_path_obstructed(self, board, to_position):
-        from_col, from_row = self.position
-        to_col, to_row = to_position
-
-        col_delta = to_col - from_col
-        row_delta = to_row - from_row
-
-        step_col = 0 if col_delta == 0 else col_delta // abs(col_delta)
-        step_row = 0 if row_delta == 0 else row_delta // abs(row_delta)
-
-        if step_col == 0 and step_row == 0:
-            return False
-
-        current_col = from_col + step_col
-        current_row = from_row + step_row
-
-        while (current_col, current_row) != (to_col, to_row):
-            if board.get_piece_at((current_col, current_row)) is not None:
-                return True
-            current_col += step_col
-            current_row += step_row
-
-        return False
+        return target_piece is None or target_piece.color_index != self.color_index
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.color}, {self.position})"
 
 class Knight(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["knight"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'N' if color == 'white' else 'n'
     
     def get_legal_moves(self, board):
-        col, row = self.position
-        moves = []
-        
-        # All possible knight move offsets
-        knight_moves = [
-            (2, 1), (2, -1), (-2, 1), (-2, -1),
-            (1, 2), (1, -2), (-1, 2), (-1, -2)
-        ]
-        
-        for col_offset, row_offset in knight_moves:
-            new_col = col + col_offset
-            new_row = row + row_offset
-
-            if self.is_valid_position((new_col, new_row)) and self.can_occupy(board, (new_col, new_row)):
-                moves.append((new_col, new_row))
-        
-        return moves
+        targets = KNIGHT_ATTACKS[self.square] & ~board.occupancy[self.color_index]
+        return list(KNIGHT_TARGET_POSITIONS[self.square][targets])
+
+    def get_move_bitboard(self, board):
+        return KNIGHT_ATTACKS[self.square] & ~board.occupancy[self.color_index]
 
 class Board:
     def __init__(self):
-        self.board = [[None for _ in range(8)] for _ in range(8)]
+        self.setup_starting_position()
+
+    def clear(self):
+        # Flat mailbox indexed by row * 8 + col, the same square numbering as the bitboards.
+        self.board = [None] * 64
         self.pieces = []
+        # The same pieces split by color_index, each in board.pieces order, so
+        # per-side loops skip the other side's pieces entirely.
+        self.pieces_by_color = [[], []]
+        # One bitboard per (color, piece type), indexed by Piece.bitboard_index.
+        self.bitboards = [0] * 12
+        self.occupancy = [0, 0]
         self.en_passant_target = None
         self.en_passant_capture_position = None
         self.halfmove_clock = 0
         self.position_counts = {}
-        self.setup_starting_position()
     
     def setup_starting_position(self):
-        # Clear board
-        self.board = [[None for _ in range(8)] for _ in range(8)]
-        self.pieces = []
-        self.en_passant_target = None
-        self.en_passant_capture_position = None
-        self.halfmove_clock = 0
-        self.position_counts = {}
-        
-        # White pieces
-        self.add_piece('white', 'rook', (0, 0))
-        self.add_piece('white', 'knight', (1, 0))
-        self.add_piece('white', 'bishop', (2, 0))
-        self.add_piece('white', 'queen', (3, 0))
-        self.add_piece('white', 'king', (4, 0))
-        self.add_piece('white', 'bishop', (5, 0))
-        self.add_piece('white', 'knight', (6, 0))
-        self.add_piece('white', 'rook', (7, 0))
-        
-        for col in range(8):
-            self.add_piece('white', 'pawn', (col, 1))
-        
-        # Black pieces
-        self.add_piece('black', 'rook', (0, 7))
-        self.add_piece('black', 'knight', (1, 7))
-        self.add_piece('black', 'bishop', (2, 7))
-        self.add_piece('black', 'queen', (3, 7))
-        self.add_piece('black', 'king', (4, 7))
-        self.add_piece('black', 'bishop', (5, 7))
-        self.add_piece('black', 'knight', (6, 7))
-        self.add_piece('black', 'rook', (7, 7))
-        
-        for col in range(8):
-            self.add_piece('black', 'pawn', (col, 6))
+        self.clear()
+
+        board = self.board
+        pieces = self.pieces
+        pieces_by_color = self.pieces_by_color
+        for color, piece_type, (col, row) in STARTING_PIECE_LAYOUT:
+            piece = PIECE_CLASSES_BY_TYPE[piece_type](color, (col, row))
+            pieces.append(piece)
+            pieces_by_color[piece.color_index].append(piece)
+            board[row * 8 + col] = piece
+        # The starting bitboards never change, so copy them instead of toggling 32 squares.
+        self.bitboards = list(STARTING_BITBOARDS)
+        self.occupancy = list(STARTING_OCCUPANCY)
 
         self.record_position('white')
     
     def add_piece(self, color, piece_type, position):
-        piece_classes = {
-            'pawn': Pawn,
-            'knight': Knight,
-            'bishop': Bishop,
-            'rook': Rook,
-            'queen': Queen,
-            'king': King
-        }
-        
-        piece_class = piece_classes.get(piece_type)
+        piece_class = PIECE_CLASSES_BY_TYPE.get(piece_type)
         if piece_class:
-            piece = piece_class(color, position)
-            self.pieces.append(piece)
-            self.board[position[1]][position[0]] = piece
+            self.place_piece(piece_class(color, position))
+
+    def place_piece(self, piece):
+        self.pieces.append(piece)
+        self.pieces_by_color[piece.color_index].append(piece)
+        self.board[piece.square] = piece
+        self._toggle_piece_bits(piece, 1 << piece.square)
+        return piece
+
+    def _toggle_piece_bits(self, piece, square_bits):
+        self.bitboards[piece.bitboard_index] ^= square_bits
+        self.occupancy[piece.color_index] ^= square_bits
+
+    def get_occupied_bitboard(self):
+        return self.occupancy[0] | self.occupancy[1]
 
     def create_promoted_piece(self, color, position, promotion_piece):
-        piece_classes = {
-            'q': Queen,
-            'r': Rook,
-            'b': Bishop,
-            'n': Knight,
-        }
-        piece_class = piece_classes.get((promotion_piece or 'q').lower())
+        piece_class = PROMOTION_CLASSES_BY_LETTER.get((promotion_piece or 'q').lower())
         if piece_class is None:
             raise ValueError(f"Invalid promotion piece: {promotion_piece}")
 
@@ -1230,7 +1670,7 @@ class Board:
     def get_piece_at(self, position):
         col, row = position
         if 0 <= col < 8 and 0 <= row < 8:
-            return self.board[row][col]
+            return self.board[row * 8 + col]
         return None
 
     def is_valid_position(self, position):
@@ -1241,56 +1681,81 @@ class Board:
         return 'black' if color == 'white' else 'white'
 
     def clone(self):
-        return copy.deepcopy(self)
+        # Rebuilt by hand rather than deepcopied: only the piece objects and the few
+        # containers below are mutable, and deepcopy's memo bookkeeping dominated search.
+        # A savefile recorder is left behind so simulations never write to the game file.
+        clone = object.__new__(self.__class__)
+        state = clone.__dict__
+        state.update(self.__dict__)
+        state.pop("savefile_recorder", None)
+
+        board = [None] * 64
+        pieces = []
+        pieces_by_color = [[], []]
+        for piece in self.pieces:
+            piece = piece.copy()
+            board[piece.square] = piece
+            pieces.append(piece)
+            pieces_by_color[piece.color_index].append(piece)
+
+        clone.board = board
+        clone.pieces = pieces
+        clone.pieces_by_color = pieces_by_color
+        clone.bitboards = self.bitboards[:]
+        clone.occupancy = self.occupancy[:]
+        clone.position_counts = self.position_counts.copy()
+        return clone
 
     def get_castling_rights(self):
-        rights = []
-
-        white_king = self.get_piece_at((4, 0))
-        if isinstance(white_king, King) and white_king.color == 'white' and not white_king.moved:
-            white_kingside_rook = self.get_piece_at((7, 0))
-            white_queenside_rook = self.get_piece_at((0, 0))
-            if isinstance(white_kingside_rook, Rook) and white_kingside_rook.color == 'white' and not white_kingside_rook.moved:
-                rights.append('K')
-            if isinstance(white_queenside_rook, Rook) and white_queenside_rook.color == 'white' and not white_queenside_rook.moved:
-                rights.append('Q')
-
-        black_king = self.get_piece_at((4, 7))
-        if isinstance(black_king, King) and black_king.color == 'black' and not black_king.moved:
-            black_kingside_rook = self.get_piece_at((7, 7))
-            black_queenside_rook = self.get_piece_at((0, 7))
-            if isinstance(black_kingside_rook, Rook) and black_kingside_rook.color == 'black' and not black_kingside_rook.moved:
-                rights.append('k')
-            if isinstance(black_queenside_rook, Rook) and black_queenside_rook.color == 'black' and not black_queenside_rook.moved:
-                rights.append('q')
-
-        return ''.join(rights) if rights else '-'
+        # Reads the four home-square mailbox slots directly; bitboard_index
+        # (color_index * 6 + type_index) identifies kings (5, 11) and rooks (3, 9)
+        # without isinstance or color-string checks.
+        board = self.board
+        rights = ""
+
+        white_king = board[4]
+        if white_king is not None and not white_king.moved and white_king.bitboard_index == 5:
+            white_kingside_rook = board[7]
+            if white_kingside_rook is not None and not white_kingside_rook.moved and white_kingside_rook.bitboard_index == 3:
+                rights = "K"
+            white_queenside_rook = board[0]
+            if white_queenside_rook is not None and not white_queenside_rook.moved and white_queenside_rook.bitboard_index == 3:
+                rights += "Q"
+
+        black_king = board[60]
+        if black_king is not None and not black_king.moved and black_king.bitboard_index == 11:
+            black_kingside_rook = board[63]
+            if black_kingside_rook is not None and not black_kingside_rook.moved and black_kingside_rook.bitboard_index == 9:
+                rights += "k"
+            black_queenside_rook = board[56]
+            if black_queenside_rook is not None and not black_queenside_rook.moved and black_queenside_rook.bitboard_index == 9:
+                rights += "q"
+
+        return rights or '-'
 
     def get_en_passant_square_for_signature(self, active_color):
         if self.en_passant_target is None:
             return '-'
 
-        target_col, target_row = self.en_passant_target
-        direction = 1 if active_color == 'white' else -1
-        source_row = target_row - direction
-
-        for source_col in (target_col - 1, target_col + 1):
-            source_position = (source_col, source_row)
-            if not self.is_valid_position(source_position):
-                continue
-            piece = self.get_piece_at(source_position)
-            if isinstance(piece, Pawn) and piece.color == active_color:
-                if self.en_passant_target in piece.get_legal_moves(self):
-                    return position_to_square(self.en_passant_target)
+        # The squares an enemy pawn on the target would attack are exactly where our
+        # capturing pawns must stand, and the table only holds on-board squares.
+        color_index = COLOR_INDEX_BY_NAME[active_color]
+        target_square = position_to_index(self.en_passant_target)
+        capturing_pawns = PAWN_ATTACKS[1 - color_index][target_square] & self.bitboards[color_index * 6]
+        for col, row in bitboard_to_positions(capturing_pawns):
+            if self.board[row * 8 + col].get_move_bitboard(self) >> target_square & 1:
+                return position_to_square(self.en_passant_target)
 
         return '-'
 
+    def get_placement_key(self):
+        # The twelve piece bitboards identify the placement exactly, so this works as a
+        # collision-free transposition key without maintaining Zobrist state per move.
+        return tuple(self.bitboards)
+
     def get_position_signature(self, active_color):
-        pieces_state = tuple(
-            sorted((piece.symbol, piece.position[0], piece.position[1]) for piece in self.pieces)
-        )
         return (
-            pieces_state,
+            self.get_placement_key(),
             active_color,
             self.get_castling_rights(),
             self.get_en_passant_square_for_signature(active_color),
@@ -1307,158 +1772,193 @@ class Board:
     def is_fifty_move_draw(self):
         return self.halfmove_clock >= 100
 
+    def find_king_square(self, color_index):
+        king_bits = self.bitboards[color_index * 6 + 5]
+        if not king_bits:
+            return None
+        return (king_bits & -king_bits).bit_length() - 1
+
     def find_king_position(self, color):
-        for piece in self.pieces:
-            if isinstance(piece, King) and piece.color == color:
-                return piece.position
-        return None
+        king_square = self.find_king_square(COLOR_INDEX_BY_NAME[color])
+        if king_square is None:
+            return None
+        return SQUARE_POSITIONS[king_square]
+
+    def attackers_to(self, square, by_color_index, occupied=None):
+        bitboards = self.bitboards
+        offset = by_color_index * 6
+        if occupied is None:
+            occupied = self.occupancy[0] | self.occupancy[1]
+        diagonal_sliders = bitboards[offset + 2] | bitboards[offset + 4]
+        straight_sliders = bitboards[offset + 3] | bitboards[offset + 4]
+        return (
+            (PAWN_ATTACKS[1 - by_color_index][square] & bitboards[offset])
+            | (KNIGHT_ATTACKS[square] & bitboards[offset + 1])
+            | (KING_ATTACKS[square] & bitboards[offset + 5])
+            | (bishop_attacks(square, occupied) & diagonal_sliders)
+            | (rook_attacks(square, occupied) & straight_sliders)
+        )
+
+    def is_attacked_by(self, square, by_color_index):
+        # attackers_to() as a yes/no answer: stop at the first piece type that hits,
+        # trying the cheap table lookups before the slider tables.
+        bitboards = self.bitboards
+        offset = by_color_index * 6
+        if PAWN_ATTACKS[1 - by_color_index][square] & bitboards[offset]:
+            return True
+        if KNIGHT_ATTACKS[square] & bitboards[offset + 1]:
+            return True
+        occupied = self.occupancy[0] | self.occupancy[1]
+        if bishop_attacks(square, occupied) & (bitboards[offset + 2] | bitboards[offset + 4]):
+            return True
+        if rook_attacks(square, occupied) & (bitboards[offset + 3] | bitboards[offset + 4]):
+            return True
+        return (KING_ATTACKS[square] & bitboards[offset + 5]) != 0
 
     def is_in_check(self, color):
-        king_position = self.find_king_position(color)
-        if king_position is None:
+        color_index = COLOR_INDEX_BY_NAME[color]
+        king_square = self.find_king_square(color_index)
+        if king_square is None:
             return False
-        return self.is_square_attacked(king_position, self.get_opponent_color(color))
+        return self.is_attacked_by(king_square, 1 - color_index)
+
+    def move_leaves_king_attacked(self, color, from_pos, to_pos):
+        # Plays the move on occupancy bits only, so no clone or make/unmake is needed.
+        color_index = COLOR_INDEX_BY_NAME[color]
+        piece = self.get_piece_at(from_pos)
+        from_bit = 1 << position_to_index(from_pos)
+        to_square = position_to_index(to_pos)
+        to_bit = 1 << to_square
+
+        captured_bit = to_bit
+        if _is_en_passant_capture_move(self, piece, to_pos) and self.en_passant_capture_position is not None:
+            captured_bit = 1 << position_to_index(self.en_passant_capture_position)
+
+        occupied = ((self.occupancy[0] | self.occupancy[1]) & ~from_bit & ~captured_bit) | to_bit
+        if isinstance(piece, King):
+            king_square = to_square
+            if abs(to_pos[0] - from_pos[0]) == 2:
+                rook_from_col, rook_to_col = (7, 5) if to_pos[0] > from_pos[0] else (0, 3)
+                if isinstance(self.get_piece_at((rook_from_col, from_pos[1])), Rook):
+                    occupied ^= (1 << position_to_index((rook_from_col, from_pos[1]))) | (
+                        1 << position_to_index((rook_to_col, from_pos[1]))
+                    )
+        else:
+            king_square = self.find_king_square(color_index)
+            if king_square is None:
+                return False
+
+        return (self.attackers_to(king_square, 1 - color_index, occupied) & ~captured_bit) != 0
 
     def is_legal_move(self, color, from_pos, to_pos, promotion_piece=None):
         piece = self.get_piece_at(from_pos)
-        if piece is None or piece.color != color:
+        if piece is None or piece.color != color or not self.is_valid_position(to_pos):
             return False
-        if to_pos not in piece.get_legal_moves(self):
+        if not piece.get_move_bitboard(self) >> position_to_index(to_pos) & 1:
             return False
         _ = promotion_piece
         return True
 
     def has_legal_move(self, color):
-        for piece in self.pieces:
-            if piece.color != color:
-                continue
-            from_pos = piece.position
-            for to_pos in piece.get_legal_moves(self):
-                if self.is_legal_move(color, from_pos, to_pos):
+        # Only existence matters, so try the cheapest attack-table checks first and
+        # leave pawns (en passant, double steps) and sliders for last.
+        color_index = COLOR_INDEX_BY_NAME[color]
+        offset = color_index * 6
+        bitboards = self.bitboards
+        not_own = ~self.occupancy[color_index]
+
+        for type_index, attack_table in ((5, KING_ATTACKS), (1, KNIGHT_ATTACKS)):
+            pieces = bitboards[offset + type_index]
+            while pieces:
+                low_bit = pieces & -pieces
+                if attack_table[low_bit.bit_length() - 1] & not_own:
+                    return True
+                pieces ^= low_bit
+
+        for col, row in bitboard_to_positions(bitboards[offset]):
+            if self.board[row * 8 + col].get_move_bitboard(self):
+                return True
+
+        occupied = self.occupancy[0] | self.occupancy[1]
+        for type_index, slider_attacks in ((2, bishop_attacks), (3, rook_attacks), (4, queen_attacks)):
+            pieces = bitboards[offset + type_index]
+            while pieces:
+                low_bit = pieces & -pieces
+                if slider_attacks(low_bit.bit_length() - 1, occupied) & not_own:
                     return True
+                pieces ^= low_bit
         return False
 
     def get_legal_moves_for_color(self, color):
+        # Every generated destination already satisfies is_legal_move, so the
+        # piece's moves are not regenerated once per destination.
         legal_moves = []
-        for piece in self.pieces:
-            if piece.color != color:
-                continue
+        for piece in self.pieces_by_color[COLOR_INDEX_BY_NAME[color]]:
             from_pos = piece.position
-            for to_pos in piece.get_legal_moves(self):
-                if self.is_legal_move(color, from_pos, to_pos):
-                    legal_moves.append((from_pos, to_pos))
+            legal_moves.extend((from_pos, to_pos) for to_pos in piece.get_legal_moves(self))
         return legal_moves
 
-    def _sliding_piece_attacks_square(self, piece, target_position, directions):
-        for col_step, row_step in directions:
-            current_col = piece.position[0] + col_step
-            current_row = piece.position[1] + row_step
-            while self.is_valid_position((current_col, current_row)):
-                if (current_col, current_row) == target_position:
-                    return True
-                if self.get_piece_at((current_col, current_row)) is not None:
-                    break
-                current_col += col_step
-                current_row += row_step
-        return False
-
     def piece_attacks_square(self, piece, target_position):
-        piece_col, piece_row = piece.position
-        target_col, target_row = target_position
-
-        if isinstance(piece, Pawn):
-            direction = 1 if piece.color == 'white' else -1
-            return (target_col, target_row) in {
-                (piece_col - 1, piece_row + direction),
-                (piece_col + 1, piece_row + direction),
-            }
-
-        if isinstance(piece, Knight):
-            return (abs(piece_col - target_col), abs(piece_row - target_row)) in {
-                (1, 2),
-                (2, 1),
-            }
-
-        if isinstance(piece, Bishop):
-            return self._sliding_piece_attacks_square(
-                piece,
-                target_position,
-                [(-1, -1), (-1, 1), (1, -1), (1, 1)],
-            )
-
-        if isinstance(piece, Rook):
-            return self._sliding_piece_attacks_square(
-                piece,
-                target_position,
-                [(-1, 0), (1, 0), (0, -1), (0, 1)],
-            )
-
-        if isinstance(piece, Queen):
-            return self._sliding_piece_attacks_square(
-                piece,
-                target_position,
-                [
-                    (-1, -1),
-                    (-1, 1),
-                    (1, -1),
-                    (1, 1),
-                    (-1, 0),
-                    (1, 0),
-                    (0, -1),
-                    (0, 1),
-                ],
-            )
-
-        if isinstance(piece, King):
-            return max(abs(piece_col - target_col), abs(piece_row - target_row)) == 1
+        if not self.is_valid_position(target_position):
+            return False
+        square = piece.square
+        target_bit = 1 << position_to_index(target_position)
+
+        # Dispatch on the class-level type_index (pawn..king = 0..5) rather than an
+        # isinstance chain.
+        type_index = piece.type_index
+        if type_index == 0:
+            attacks = PAWN_ATTACKS[piece.color_index][square]
+        elif type_index == 1:
+            attacks = KNIGHT_ATTACKS[square]
+        elif type_index == 5:
+            attacks = KING_ATTACKS[square]
+        else:
+            # Slider lookups only need the blockers, so the ray walk is a table read.
+            attacks = SLIDER_ATTACKS_BY_TYPE[type_index](square, self.occupancy[0] | self.occupancy[1])
 
-        return False
+        return (attacks & target_bit) != 0
 
     def is_square_attacked(self, position, by_color):
-        for piece in self.pieces:
-            if piece.color == by_color and self.piece_attacks_square(piece, position):
-                return True
-        return False
+        return self.is_attacked_by(position_to_index(position), COLOR_INDEX_BY_NAME[by_color])
 
     def get_castling_moves(self, king):
         if king.moved:
             return []
 
-        home_row = 0 if king.color == 'white' else 7
-        if king.position != (4, home_row):
+        home_square, castle_rules = CASTLE_RULES[king.color_index]
+        if king.square != home_square:
             return []
 
-        castle_rules = [
-            {
-                'rook_position': (7, home_row),
-                'required_empty': [(5, home_row), (6, home_row)],
-                'king_destination': (6, home_row),
-            },
-            {
-                'rook_position': (0, home_row),
-                'required_empty': [(1, home_row), (2, home_row), (3, home_row)],
-                'king_destination': (2, home_row),
-            },
-        ]
-
+        occupied = self.occupancy[0] | self.occupancy[1]
+        rook_bitboard = self.bitboards[king.color_index * 6 + 3]
         available_moves = []
-        for rule in castle_rules:
-            rook = self.get_piece_at(rule['rook_position'])
-            if not isinstance(rook, Rook) or rook.color != king.color or rook.moved:
+        for rook_square, required_empty, king_destination in castle_rules:
+            if not rook_bitboard >> rook_square & 1 or occupied & required_empty:
                 continue
-            if any(self.get_piece_at(position) is not None for position in rule['required_empty']):
+            if self.board[rook_square].moved:
                 continue
-            available_moves.append(rule['king_destination'])
+            available_moves.append(king_destination)
 
         return available_moves
     
+    def _discard_piece(self, piece):
+        # One identity scan instead of a membership test followed by remove(). The list
+        # keeps its order because the C search walks pieces in this order.
+        try:
+            self.pieces.remove(piece)
+            self.pieces_by_color[piece.color_index].remove(piece)
+        except ValueError:
+            pass
+
     def remove_piece_at(self, position):
         col, row = position
-        piece = self.board[row][col]
+        square = row * 8 + col
+        piece = self.board[square]
         if piece:
-            if piece in self.pieces:
-                self.pieces.remove(piece)
-            self.board[row][col] = None
+            self._discard_piece(piece)
+            self.board[square] = None
+            self._toggle_piece_bits(piece, 1 << square)
     
     def move_piece(self, from_pos, to_pos, update_tracking=True, promotion_piece=None):
         piece = self.get_piece_at(from_pos)
@@ -1468,9 +1968,13 @@ class Board:
         from_col, from_row = from_pos
         to_col, to_row = to_pos
         target_piece = self.get_piece_at(to_pos)
+        # Pawn and king side effects are keyed on the class-level type_index
+        # (pawn 0, king 5), checked once, rather than isinstance after the move.
+        type_index = piece.type_index
+        is_pawn_move = type_index == 0
 
         is_en_passant_capture = (
-            isinstance(piece, Pawn)
+            is_pawn_move
             and target_piece is None
             and from_col != to_col
             and self.en_passant_target == to_pos
@@ -1479,47 +1983,45 @@ class Board:
 
         is_capture = target_piece is not None or is_en_passant_capture
 
+        from_square = from_row * 8 + from_col
+        to_square = to_row * 8 + to_col
+        to_bit = 1 << to_square
         if is_en_passant_capture:
             self.remove_piece_at(self.en_passant_capture_position)
         elif target_piece is not None:
-            self.remove_piece_at(to_pos)
+            # The mover overwrites the mailbox slot below, so only the piece lists
+            # and the captured piece's bits need updating here.
+            self._discard_piece(target_piece)
+            self._toggle_piece_bits(target_piece, to_bit)
 
-        self.board[from_pos[1]][from_pos[0]] = None
-        self.board[to_pos[1]][to_pos[0]] = piece
+        self.board[from_square] = None
+        self.board[to_square] = piece
         piece.position = to_pos
-
-        is_pawn_move = isinstance(piece, Pawn)
-        is_promotion_rank = is_pawn_move and (to_row == 7 or to_row == 0)
-        if is_promotion_rank:
-            if piece in self.pieces:
-                self.pieces.remove(piece)
-            promoted_piece = self.create_promoted_piece(piece.color, to_pos, promotion_piece)
-            self.pieces.append(promoted_piece)
-            self.board[to_pos[1]][to_pos[0]] = promoted_piece
-            piece = promoted_piece
-
-        is_castling_move = isinstance(piece, King) and abs(to_col - from_col) == 2
-        if is_castling_move:
-            if to_col > from_col:
-                rook_from = (7, from_row)
-                rook_to = (5, from_row)
-            else:
-                rook_from = (0, from_row)
-                rook_to = (3, from_row)
-            rook = self.get_piece_at(rook_from)
-            if isinstance(rook, Rook):
-                self.board[rook_from[1]][rook_from[0]] = None
-                self.board[rook_to[1]][rook_to[0]] = rook
-                rook.position = rook_to
-                rook.moved = True
-
+        piece.square = to_square
+        self._toggle_piece_bits(piece, (1 << from_square) | to_bit)
         piece.moved = True
 
         self.en_passant_target = None
         self.en_passant_capture_position = None
-        if isinstance(piece, Pawn) and abs(to_row - from_row) == 2:
-            self.en_passant_target = (from_col, (from_row + to_row) // 2)
-            self.en_passant_capture_position = (to_col, to_row)
+        if is_pawn_move:
+            if to_row == 7 or to_row == 0:
+                self._discard_piece(piece)
+                self._toggle_piece_bits(piece, to_bit)
+                promoted_piece = self.create_promoted_piece(piece.color, to_pos, promotion_piece)
+                piece = self.place_piece(promoted_piece)
+            elif to_row - from_row == 2 or from_row - to_row == 2:
+                self.en_passant_target = (from_col, (from_row + to_row) // 2)
+                self.en_passant_capture_position = (to_col, to_row)
+        elif type_index == 5 and (to_col - from_col == 2 or from_col - to_col == 2):
+            rook_from_square = from_square + 3 if to_col > from_col else from_square - 4
+            rook = self.board[rook_from_square]
+            if isinstance(rook, Rook):
+                self.board[rook_from_square] = None
+                rook.square = from_square + 1 if to_col > from_col else from_square - 1
+                self.board[rook.square] = rook
+                rook.position = SQUARE_POSITIONS[rook.square]
+                rook.moved = True
+                self._toggle_piece_bits(rook, (1 << rook_from_square) | (1 << rook.square))
 
         if update_tracking:
             if is_pawn_move or is_capture:
@@ -1527,24 +2029,17 @@ class Board:
             else:
                 self.halfmove_clock += 1
 
-            next_color = self.get_opponent_color(piece.color)
-            self.record_position(next_color)
+            self.record_position(COLOR_NAMES[1 - piece.color_index])
 
         return True
     
     def __str__(self):
-        board_str = "  a b c d e f g h\n"
+        lines = ["  a b c d e f g h"]
         for row_idx in range(7, -1, -1):
-            row = self.board[row_idx]
-            board_str += f"{row_idx + 1} "
-            for piece in row:
-                if piece:
-                    board_str += f"{piece.symbol} "
-                else:
-                    board_str += ". "
-            board_str += f"{row_idx + 1}\n"
-        board_str += "  a b c d e f g h"
-        return board_str
+            cells = [piece.symbol if piece else "." for piece in self.board[row_idx * 8:row_idx * 8 + 8]]
+            lines.append(f"{row_idx + 1} {' '.join(cells)} {row_idx + 1}")
+        lines.append("  a b c d e f g h")
+        return "\n".join(lines)
 
 
 def apply_coordinate_move(board, color, move_text, record=True):
@@ -1555,10 +2050,6 @@ def apply_coordinate_move(board, color, move_text, record=True):
     return board.get_piece_at(to_position), to_position, normalized_move
 
 
-def _piece_matches_type(piece, piece_type):
-    return piece.__class__.__name__.lower() == piece_type
-
-
 def _is_en_passant_capture_move(board, piece, to_position):
     if not isinstance(piece, Pawn):
         return False
@@ -1604,7 +2095,8 @@ def has_legal_move(board, color):
     return board.has_legal_move(color)
 
 
-def get_game_status(board, active_color):
+def get_game_status(board, active_color, legal_moves=None):
+    # Callers that already generated the side's moves pass them in to skip has_legal_move.
     white_king = board.find_king_position("white")
     black_king = board.find_king_position("black")
     if white_king is None and black_king is None:
@@ -1620,7 +2112,8 @@ def get_game_status(board, active_color):
     if board.is_fifty_move_draw():
         return {"state": "draw", "reason": "fifty_move_rule", "winner": None}
 
-    if not board.has_legal_move(active_color):
+    has_moves = bool(legal_moves) if legal_moves is not None else board.has_legal_move(active_color)
+    if not has_moves:
         return {"state": "draw", "reason": "stalemate", "winner": None}
 
     return {"state": "in_progress", "reason": None, "winner": None}
@@ -1628,7 +2121,7 @@ def get_game_status(board, active_color):
 
 def _pawn_rank_for_value(pawn):
     _, row = pawn.position
-    if pawn.color == "white":
+    if pawn.color_index == 0:
         return row + 1
     return 8 - row
 
@@ -1638,43 +2131,27 @@ def _is_backward_pawn(board, pawn):
         return False
 
     col, row = pawn.position
-    direction = 1 if pawn.color == "white" else -1
-    forward_square = (col, row + direction)
-    if not board.is_valid_position(forward_square):
+    color_index = pawn.color_index
+    forward_row = row + 1 if color_index == 0 else row - 1
+    if not 0 <= forward_row < 8:
         return False
 
-    has_adjacent_support = False
-    for adjacent_col in (col - 1, col + 1):
-        if not (0 <= adjacent_col < 8):
-            continue
-        for scan_row in range(8):
-            adjacent_piece = board.get_piece_at((adjacent_col, scan_row))
-            if not isinstance(adjacent_piece, Pawn) or adjacent_piece.color != pawn.color:
-                continue
-            if pawn.color == "white" and scan_row >= row:
-                has_adjacent_support = True
-            if pawn.color == "black" and scan_row <= row:
-                has_adjacent_support = True
-            if has_adjacent_support:
-                break
-        if has_adjacent_support:
-            break
-
-    if has_adjacent_support:
+    own_pawns = board.bitboards[color_index * 6]
+    if own_pawns & PAWN_SUPPORT_MASKS[color_index][row * 8 + col]:
         return False
 
-    opponent_color = board.get_opponent_color(pawn.color)
-    for piece in board.pieces:
-        if isinstance(piece, Pawn) and piece.color == opponent_color and board.piece_attacks_square(piece, forward_square):
-            return True
+    # Enemy pawns attacking the forward square stand where our pawn would attack from it.
+    opponent_pawns = board.bitboards[(1 - color_index) * 6]
+    return (PAWN_ATTACKS[color_index][forward_row * 8 + col] & opponent_pawns) != 0
 
-    return False
 
+# Profiles share a handful of multiplier sets; the limit only guards callers that
+# keep generating new ones.
+SQUARE_WEIGHT_TABLES_CACHE_LIMIT = 64
+_SQUARE_WEIGHT_TABLES_CACHE = {}
 
-def _square_weight_for_piece(piece, square, position_multipliers):
-    if not position_multipliers:
-        return 1.0
 
+def _square_weight(is_rook, square, position_multipliers):
     col, row = square
     center_squares = {(3, 3), (4, 3), (3, 4), (4, 4)}
     center_cross_squares = {(2, 3), (2, 4), (3, 2), (4, 2), (5, 3), (5, 4), (3, 5), (4, 5)}
@@ -1683,12 +2160,12 @@ def _square_weight_for_piece(piece, square, position_multipliers):
     corner_touch_squares = {(1, 0), (0, 1), (6, 0), (7, 1), (0, 6), (1, 7), (6, 7), (7, 6)}
 
     if (col, row) in corner_squares:
-        if isinstance(piece, Rook):
+        if is_rook:
             return position_multipliers.get("corner_rook", position_multipliers.get("corner", 1.0))
         return position_multipliers.get("corner", 1.0)
 
     if (col, row) in corner_touch_squares:
-        if isinstance(piece, Rook):
+        if is_rook:
             return position_multipliers.get("corner_touch_rook", position_multipliers.get("corner_touch", 1.0))
         return position_multipliers.get("corner_touch", 1.0)
 
@@ -1704,17 +2181,51 @@ def _square_weight_for_piece(piece, square, position_multipliers):
     return 1.0
 
 
+def _square_weight_tables(position_multipliers):
+    # One 64-entry table per piece type, built once per distinct set of multipliers.
+    # Keyed on the contents, so equal profiles share tables and a dict edited in place
+    # gets fresh ones.
+    key = tuple(sorted(position_multipliers.items()))
+    tables = _SQUARE_WEIGHT_TABLES_CACHE.get(key)
+    if tables is not None:
+        return tables
+
+    other_weights = tuple(_square_weight(False, square, position_multipliers) for square in SQUARE_POSITIONS)
+    rook_weights = tuple(_square_weight(True, square, position_multipliers) for square in SQUARE_POSITIONS)
+    tables = tuple(
+        rook_weights if type_index == PIECE_INDEX_BY_TYPE["rook"] else other_weights
+        for type_index in range(len(PIECE_ORDER))
+    )
+    if len(_SQUARE_WEIGHT_TABLES_CACHE) >= SQUARE_WEIGHT_TABLES_CACHE_LIMIT:
+        _SQUARE_WEIGHT_TABLES_CACHE.clear()
+    _SQUARE_WEIGHT_TABLES_CACHE[key] = tables
+    return tables
+
+
+def _square_weight_for_piece(piece, square, position_multipliers):
+    if not position_multipliers:
+        return 1.0
+    col, row = square
+    return _square_weight_tables(position_multipliers)[piece.type_index][row * 8 + col]
+
+
 def _position_multiplier(piece, position_multipliers):
     return _square_weight_for_piece(piece, piece.position, position_multipliers)
 
 
 def _control_score(board, perspective_color, position_multipliers):
+    weight_tables = _square_weight_tables(position_multipliers) if position_multipliers else None
+    perspective_index = COLOR_INDEX_BY_NAME[perspective_color]
     total = 0.0
     for piece in board.pieces:
         controlled = 0.0
-        for square in piece.get_legal_moves(board):
-            controlled += _square_weight_for_piece(piece, square, position_multipliers)
-        if piece.color == perspective_color:
+        if weight_tables is None:
+            controlled += bin(piece.get_move_bitboard(board)).count("1")
+        else:
+            weights = weight_tables[piece.type_index]
+            for col, row in piece.get_legal_moves(board):
+                controlled += weights[row * 8 + col]
+        if piece.color_index == perspective_index:
             total += controlled
         else:
             total -= controlled
@@ -1722,14 +2233,15 @@ def _control_score(board, perspective_color, position_multipliers):
 
 
 def _has_opposite_color_bishops(board):
-    white_bishops = [piece for piece in board.pieces if isinstance(piece, Bishop) and piece.color == "white"]
-    black_bishops = [piece for piece in board.pieces if isinstance(piece, Bishop) and piece.color == "black"]
-    if len(white_bishops) != 1 or len(black_bishops) != 1:
+    bishop_index = PIECE_INDEX_BY_TYPE["bishop"]
+    white_bishops = board.bitboards[bishop_index]
+    black_bishops = board.bitboards[len(PIECE_ORDER) + bishop_index]
+    # Exactly one bishop each: non-zero with no second bit left after clearing the lowest.
+    if not white_bishops or white_bishops & (white_bishops - 1):
         return False
-
-    white_square_color = (white_bishops[0].position[0] + white_bishops[0].position[1]) % 2
-    black_square_color = (black_bishops[0].position[0] + black_bishops[0].position[1]) % 2
-    return white_square_color != black_square_color
+    if not black_bishops or black_bishops & (black_bishops - 1):
+        return False
+    return bool(white_bishops & LIGHT_SQUARES) != bool(black_bishops & LIGHT_SQUARES)
 
 
 def _evaluate_piece_scores(
@@ -1738,10 +2250,9 @@ def _evaluate_piece_scores(
     piece_values,
     pawn_rank_values=None,
     backward_pawn_value=None,
-    position_multipliers=None,
+    weight_tables=None,
 ):
-    piece_type = PIECE_TYPE_BY_CLASS[piece.__class__.__name__]
-    material_score = piece_values[piece_type]
+    material_score = piece_values[PIECE_ORDER[piece.type_index]]
     piece_score = material_score
 
     if isinstance(piece, Pawn):
@@ -1751,7 +2262,8 @@ def _evaluate_piece_scores(
         if backward_pawn_value is not None and _is_backward_pawn(board, piece):
             piece_score = min(piece_score, backward_pawn_value)
 
-    piece_score *= _position_multiplier(piece, position_multipliers)
+    if weight_tables is not None:
+        piece_score *= weight_tables[piece.type_index][piece.square]
     heuristic_score = piece_score - material_score
     return material_score, heuristic_score
 
@@ -1764,6 +2276,9 @@ def _evaluate_position_scores_python_base(
     backward_pawn_value=None,
     position_multipliers=None,
 ):
+    perspective_index = COLOR_INDEX_BY_NAME[perspective_color]
+    # Looked up once per position: the tables are keyed on the multipliers' contents.
+    weight_tables = _square_weight_tables(position_multipliers) if position_multipliers else None
     material_score = 0.0
     heuristic_score = 0.0
     for piece in board.pieces:
@@ -1773,9 +2288,9 @@ def _evaluate_position_scores_python_base(
             piece_values,
             pawn_rank_values=pawn_rank_values,
             backward_pawn_value=backward_pawn_value,
-            position_multipliers=position_multipliers,
+            weight_tables=weight_tables,
         )
-        if piece.color == perspective_color:
+        if piece.color_index == perspective_index:
             material_score += piece_material
             heuristic_score += piece_heuristic
         else:
@@ -1852,7 +2367,8 @@ def minimax_score(
     control_weight=0.0,
     opposite_bishop_draw_factor=None,
 ):
-    status = get_game_status(board, active_color)
+    legal_moves = board.get_legal_moves_for_color(active_color) if remaining_plies > 0 else None
+    status = get_game_status(board, active_color, legal_moves=legal_moves)
     if status["winner"] is not None:
         return (100000.0, 0.0) if status["winner"] == perspective_color else (-100000.0, 0.0)
     if status["state"] == "draw":
@@ -1869,7 +2385,6 @@ def minimax_score(
             opposite_bishop_draw_factor=opposite_bishop_draw_factor,
         )
 
-    legal_moves = board.get_legal_moves_for_color(active_color)
     next_color = board.get_opponent_color(active_color)
 
     if active_color == perspective_color:
@@ -2179,6 +2694,7 @@ def play_match(game_setup, savefile_path=DEFAULT_SAVEFILE, ai_vs_ai_show_board=T
             except ValueError as error:
                 print(f"Illegal move: {error}")
     finally:
+        savefile_recorder.close()
         _destroy_match_ai_caches(ai_caches)
 
 
@@ -2194,150 +2710,136 @@ def play_cli(savefile_path=DEFAULT_SAVEFILE):
         print("Returning to main menu.")
 
 class Pawn(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["pawn"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'P' if color == 'white' else 'p'
     
     def get_legal_moves(self, board):
-        col, row = self.position
+        # Direction, start rank and capture squares all come from color-indexed tables.
+        color_index = self.color_index
+        occupied = board.occupancy[0] | board.occupancy[1]
         moves = []
-        
-        direction = 1 if self.color == 'white' else -1
-        
-        # One step forward
-        new_row = row + direction
-        if 0 <= new_row < 8 and board.get_piece_at((col, new_row)) is None:
-            moves.append((col, new_row))
-        
-        # Two steps forward from starting position
-        if (self.color == 'white' and row == 1) or (self.color == 'black' and row == 6):
-            two_steps = row + 2 * direction
-            if 0 <= two_steps < 8 and board.get_piece_at((col, row + direction)) is None and board.get_piece_at((col, two_steps)) is None:
-                moves.append((col, two_steps))
-
-        # Captures
-        for col_offset in (-1, 1):
-            capture_col = col + col_offset
-            capture_row = row + direction
-            if self.is_valid_position((capture_col, capture_row)):
-                target_piece = board.get_piece_at((capture_col, capture_row))
-                if target_piece is not None and target_piece.color != self.color:
-                    moves.append((capture_col, capture_row))
-                elif board.en_passant_target == (capture_col, capture_row):
-                    capture_position = board.en_passant_capture_position
-                    captured_piece = board.get_piece_at(capture_position) if capture_position else None
-                    if (
-                        isinstance(captured_piece, Pawn)
-                        and captured_piece.color != self.color
-                        and capture_position == (capture_col, row)
-                    ):
-                        moves.append((capture_col, capture_row))
-        
+
+        single_square, double_square = PAWN_PUSH_SQUARES[color_index][self.square]
+        if single_square is not None and not occupied >> single_square & 1:
+            moves.append(SQUARE_POSITIONS[single_square])
+            if double_square is not None and not occupied >> double_square & 1:
+                moves.append(SQUARE_POSITIONS[double_square])
+
+        # Ascending square order keeps the lower file first, as the old per-file loop did.
+        moves.extend(bitboard_to_positions(self._capture_bitboard(board)))
+        return moves
+
+    def get_move_bitboard(self, board):
+        occupied = board.occupancy[0] | board.occupancy[1]
+        moves = self._capture_bitboard(board)
+        single_square, double_square = PAWN_PUSH_SQUARES[self.color_index][self.square]
+        if single_square is not None and not occupied >> single_square & 1:
+            moves |= 1 << single_square
+            if double_square is not None and not occupied >> double_square & 1:
+                moves |= 1 << double_square
         return moves
 
+    def _capture_bitboard(self, board):
+        attacks = PAWN_ATTACKS[self.color_index][self.square]
+        captures = attacks & board.occupancy[1 - self.color_index]
+        en_passant_target = board.en_passant_target
+        if en_passant_target is not None:
+            en_passant_bit = 1 << position_to_index(en_passant_target)
+            capture_position = board.en_passant_capture_position
+            if (
+                attacks & en_passant_bit
+                and capture_position == (en_passant_target[0], self.position[1])
+            ):
+                captured_piece = board.get_piece_at(capture_position)
+                if isinstance(captured_piece, Pawn) and captured_piece.color_index != self.color_index:
+                    captures |= en_passant_bit
+        return captures
+
 class Bishop(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["bishop"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'B' if color == 'white' else 'b'
     
     def get_legal_moves(self, board):
-        col, row = self.position
-        moves = []
-        
-        # Diagonal directions
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dcol, drow in directions:
-            new_col, new_row = col + dcol, row + drow
-            while self.is_valid_position((new_col, new_row)):
-                if self.is_path_obstructed(board, (new_col, new_row)):
-                    break
-                if self.can_occupy(board, (new_col, new_row)):
-                    moves.append((new_col, new_row))
-                if board.get_piece_at((new_col, new_row)) is not None:
-                    break
-                new_col += dcol
-                new_row += drow
-        
-        return moves
+        attacks = bishop_attacks(self.square, board.get_occupied_bitboard())
+        return ray_targets_to_positions(BISHOP_RAY_POSITIONS[self.square], attacks & ~board.occupancy[self.color_index])
+
+    def get_move_bitboard(self, board):
+        return bishop_attacks(self.square, board.get_occupied_bitboard()) & ~board.occupancy[self.color_index]
 
 class Rook(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["rook"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'R' if color == 'white' else 'r'
     
     def get_legal_moves(self, board):
-        col, row = self.position
-        moves = []
-        
-        # Straight directions
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dcol, drow in directions:
-            new_col, new_row = col + dcol, row + drow
-            while self.is_valid_position((new_col, new_row)):
-                if self.is_path_obstructed(board, (new_col, new_row)):
-                    break
-                if self.can_occupy(board, (new_col, new_row)):
-                    moves.append((new_col, new_row))
-                if board.get_piece_at((new_col, new_row)) is not None:
-                    break
-                new_col += dcol
-                new_row += drow
-        
-        return moves
+        attacks = rook_attacks(self.square, board.get_occupied_bitboard())
+        return ray_targets_to_positions(ROOK_RAY_POSITIONS[self.square], attacks & ~board.occupancy[self.color_index])
+
+    def get_move_bitboard(self, board):
+        return rook_attacks(self.square, board.get_occupied_bitboard()) & ~board.occupancy[self.color_index]
 
 class Queen(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["queen"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'Q' if color == 'white' else 'q'
     
     def get_legal_moves(self, board):
-        col, row = self.position
-        moves = []
-        
-        # All directions (rook + bishop)
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1),
-                      (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dcol, drow in directions:
-            new_col, new_row = col + dcol, row + drow
-            while self.is_valid_position((new_col, new_row)):
-                if self.is_path_obstructed(board, (new_col, new_row)):
-                    break
-                if self.can_occupy(board, (new_col, new_row)):
-                    moves.append((new_col, new_row))
-                if board.get_piece_at((new_col, new_row)) is not None:
-                    break
-                new_col += dcol
-                new_row += drow
-        
-        return moves
+        attacks = queen_attacks(self.square, board.get_occupied_bitboard())
+        return ray_targets_to_positions(QUEEN_RAY_POSITIONS[self.square], attacks & ~board.occupancy[self.color_index])
+
+    def get_move_bitboard(self, board):
+        return queen_attacks(self.square, board.get_occupied_bitboard()) & ~board.occupancy[self.color_index]
 
 class King(Piece):
+    __slots__ = ()
+    type_index = PIECE_INDEX_BY_TYPE["king"]
+
     def __init__(self, color, position):
         super().__init__(color, position)
         self.symbol = 'K' if color == 'white' else 'k'
     
     def get_legal_moves(self, board):
-        col, row = self.position
-        moves = []
-        
-        # All adjacent squares
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1),
-                      (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dcol, drow in directions:
-            new_col, new_row = col + dcol, row + drow
-            if (
-                self.is_valid_position((new_col, new_row))
-                and self.can_occupy(board, (new_col, new_row))
-            ):
-                moves.append((new_col, new_row))
-
+        targets = KING_ATTACKS[self.square] & ~board.occupancy[self.color_index]
+        moves = list(KING_TARGET_POSITIONS[self.square][targets])
         moves.extend(board.get_castling_moves(self))
 
         return moves
 
+    def get_move_bitboard(self, board):
+        moves = KING_ATTACKS[self.square] & ~board.occupancy[self.color_index]
+        for destination in board.get_castling_moves(self):
+            moves |= 1 << position_to_index(destination)
+        return moves
+
+PIECE_CLASSES_BY_TYPE = {
+    'pawn': Pawn,
+    'knight': Knight,
+    'bishop': Bishop,
+    'rook': Rook,
+    'queen': Queen,
+    'king': King,
+}
+
+PROMOTION_CLASSES_BY_LETTER = {
+    'q': Queen,
+    'r': Rook,
+    'b': Bishop,
+    'n': Knight,
+}
+
 if __name__ == "__main__":
     play_cli()
@@ -7,6 +7,7 @@ from chess import (
     Board,
     King,
     Pawn,
+    Rook,
     SavefileRecorder,
     apply_coordinate_move,
     choose_ai_move,
@@ -30,12 +31,7 @@ def _opponent(color):
 
 
 def _reset_board(board):
-    board.board = [[None for _ in range(8)] for _ in range(8)]
-    board.pieces = []
-    board.en_passant_target = None
-    board.en_passant_capture_position = None
-    board.halfmove_clock = 0
-    board.position_counts = {}
+    board.clear()
 
 
 def _set_castling_flags_from_fen(board, castling):
@@ -60,22 +56,22 @@ def _set_castling_flags_from_fen(board, castling):
 
     if "K" in castling:
         rook = board.get_piece_at((7, 0))
-        if rook is None or rook.__class__.__name__ != "Rook" or rook.color != "white":
+        if not isinstance(rook, Rook) or rook.color != "white":
             raise ValueError("Invalid FEN castling rights: missing white rook on h1")
         rook.moved = False
     if "Q" in castling:
         rook = board.get_piece_at((0, 0))
-        if rook is None or rook.__class__.__name__ != "Rook" or rook.color != "white":
+        if not isinstance(rook, Rook) or rook.color != "white":
             raise ValueError("Invalid FEN castling rights: missing white rook on a1")
         rook.moved = False
     if "k" in castling:
         rook = board.get_piece_at((7, 7))
-        if rook is None or rook.__class__.__name__ != "Rook" or rook.color != "black":
+        if not isinstance(rook, Rook) or rook.color != "black":
             raise ValueError("Invalid FEN castling rights: missing black rook on h8")
         rook.moved = False
     if "q" in castling:
         rook = board.get_piece_at((0, 7))
-        if rook is None or rook.__class__.__name__ != "Rook" or rook.color != "black":
+        if not isinstance(rook, Rook) or rook.color != "black":
             raise ValueError("Invalid FEN castling rights: missing black rook on a8")
         rook.moved = False
 
@@ -214,23 +210,18 @@ def _is_standard_legal_move(board, color, move):
     if piece is None or piece.color != color:
         return False
 
+    if board.find_king_position(color) is None:
+        return False
+
     if isinstance(piece, King) and abs(to_pos[0] - from_pos[0]) == 2:
         if board.is_in_check(color):
             return False
         step = 1 if to_pos[0] > from_pos[0] else -1
         middle_pos = (from_pos[0] + step, from_pos[1])
-        middle = board.clone()
-        if not middle.move_piece(from_pos, middle_pos, update_tracking=False):
-            return False
-        if middle.is_in_check(color):
+        if board.move_leaves_king_attacked(color, from_pos, middle_pos):
             return False
 
-    simulation = board.clone()
-    if not simulation.move_piece(from_pos, to_pos, update_tracking=False):
-        return False
-    if simulation.find_king_position(color) is None:
-        return False
-    return not simulation.is_in_check(color)
+    return not board.move_leaves_king_attacked(color, from_pos, to_pos)
 
 
 def _choose_fallback_standard_move(board, color, profile):
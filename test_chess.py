@@ -1,3 +1,5 @@
+import copy
+import os
 import tempfile
 import random
 import subprocess
@@ -7,6 +9,11 @@ import builtins
 from chess import (
     _evaluate_position_scores_c_base,
     _evaluate_position_scores_python_base,
+    _evaluate_positions_scores_c_batch,
+    _has_opposite_color_bishops,
+    _square_weight,
+    _square_weight_tables,
+    COLOR_INDEX_BY_NAME,
     Board,
     Bishop,
     King,
@@ -22,6 +29,7 @@ from chess import (
     apply_user_move,
     choose_ai_move,
     choose_minimax_legal_move,
+    minimax_score,
     choose_random_legal_move,
     c_evaluator_available,
     c_search_available,
@@ -41,28 +49,23 @@ from chess import (
     position_to_square,
     record_move,
     set_savefile_recorder,
+    square_to_position,
     start_savefile,
 )
+import benchmark_eval
+from benchmark_eval import _evaluate_python, _sample_positions, _with_eval_cache
 from chess_uci import move_to_uci, parse_uci_position
 from run_tournament import build_fixtures, rank_rows_with_tiebreakers, run_tournament
 
 
 def _empty_board():
     board = Board()
-    board.board = [[None for _ in range(8)] for _ in range(8)]
-    board.pieces = []
-    board.en_passant_target = None
-    board.en_passant_capture_position = None
-    board.halfmove_clock = 0
-    board.position_counts = {}
+    board.clear()
     return board
 
 
 def _place(board, piece):
-    col, row = piece.position
-    board.board[row][col] = piece
-    board.pieces.append(piece)
-    return piece
+    return board.place_piece(piece)
 
 
 def _replay_moves(moves):
@@ -157,6 +160,329 @@ def test_pawn_forward_and_diagonal_captures():
     assert set(pawn.get_legal_moves(board)) == {(4, 2), (4, 3), (3, 2), (5, 2)}
 
 
+def _assert_bitboards_match_pieces(board):
+    expected_bitboards = [0] * 12
+    for piece in board.pieces:
+        col, row = piece.position
+        assert piece.square == row * 8 + col
+        assert board.board[piece.square] is piece
+        expected_bitboards[piece.bitboard_index] |= 1 << (row * 8 + col)
+    assert len(board.board) == 64
+    assert sum(1 for piece in board.board if piece is not None) == len(board.pieces)
+    for color_index in (0, 1):
+        assert board.pieces_by_color[color_index] == [
+            piece for piece in board.pieces if piece.color_index == color_index
+        ]
+    assert board.bitboards == expected_bitboards
+    assert board.occupancy == [
+        expected_bitboards[0] | expected_bitboards[1] | expected_bitboards[2]
+        | expected_bitboards[3] | expected_bitboards[4] | expected_bitboards[5],
+        expected_bitboards[6] | expected_bitboards[7] | expected_bitboards[8]
+        | expected_bitboards[9] | expected_bitboards[10] | expected_bitboards[11],
+    ]
+
+
+def test_knight_and_king_moves_use_attack_tables():
+    board = _empty_board()
+    knight = _place(board, Knight("white", (0, 0)))
+    king = _place(board, King("white", (7, 7)))
+    _place(board, Pawn("white", (1, 2)))
+    _place(board, Pawn("black", (6, 6)))
+
+    assert set(knight.get_legal_moves(board)) == {(2, 1)}
+    assert set(king.get_legal_moves(board)) == {(6, 7), (7, 6), (6, 6)}
+
+
+def _offset_walk_moves(board, piece, offsets, sliding):
+    # Reference generator in the original per-offset, nearest-first order.
+    col, row = piece.position
+    moves = []
+    for col_step, row_step in offsets:
+        target_col, target_row = col + col_step, row + row_step
+        while 0 <= target_col < 8 and 0 <= target_row < 8:
+            target_piece = board.get_piece_at((target_col, target_row))
+            if target_piece is None or target_piece.color != piece.color:
+                moves.append((target_col, target_row))
+            if target_piece is not None or not sliding:
+                break
+            target_col += col_step
+            target_row += row_step
+    return moves
+
+
+def test_step_moves_keep_offset_order():
+    knight_offsets = ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))
+    king_offsets = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+    start = Board()
+    assert start.get_piece_at((1, 0)).get_legal_moves(start) == [(2, 2), (0, 2)]
+
+    rng = random.Random(9)
+    board = Board()
+    current_turn = "white"
+    for _ in range(80):
+        for piece in board.pieces:
+            if isinstance(piece, Knight):
+                assert piece.get_legal_moves(board) == _offset_walk_moves(board, piece, knight_offsets, False)
+            elif isinstance(piece, King):
+                expected = _offset_walk_moves(board, piece, king_offsets, False) + board.get_castling_moves(piece)
+                assert piece.get_legal_moves(board) == expected
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if get_game_status(board, current_turn)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_slider_moves_keep_ray_order():
+    rook_directions = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    bishop_directions = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+    directions_by_class = {
+        Rook: rook_directions,
+        Bishop: bishop_directions,
+        Queen: rook_directions + bishop_directions,
+    }
+
+    rng = random.Random(13)
+    board = Board()
+    current_turn = "white"
+    for _ in range(120):
+        for piece in board.pieces:
+            directions = directions_by_class.get(type(piece))
+            if directions is not None:
+                assert piece.get_legal_moves(board) == _offset_walk_moves(board, piece, directions, True)
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if get_game_status(board, current_turn)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_benchmark_sampling_matches_baseline_move_order():
+    # Pinned from the original per-piece move generators: the seeded walk picks moves
+    # by index, so any change in generation order samples different positions.
+    profile = next(entry for entry in get_ai_profiles() if entry["id"] == "d2_pawnwise_control")
+    positions = _sample_positions(200, 18, random.Random(7))
+
+    placement_digest = sum(
+        ord(piece.symbol) * (piece.position[1] * 8 + piece.position[0] + 1)
+        for board in positions
+        for piece in board.pieces
+    )
+    assert placement_digest == 21685374
+    assert round(sum(_evaluate_python(positions, "white", profile)), 4) == 47.14
+
+
+def test_benchmark_eval_cache_batches_misses_per_pass():
+    profile = next(entry for entry in get_ai_profiles() if entry["id"] == "d2_pawnwise_control")
+    positions = _sample_positions(60, 6, random.Random(3))
+    positions += positions[:10]
+    batch_sizes = []
+
+    def counting_evaluator(batch, perspective_color, batch_profile):
+        batch_sizes.append(len(batch))
+        return _evaluate_python(batch, perspective_color, batch_profile)
+
+    cached = _with_eval_cache(counting_evaluator)
+    expected = _evaluate_python(positions, "white", profile)
+    unique_count = len({board.get_placement_key() for board in positions})
+
+    assert cached(positions, "white", profile) == expected
+    assert batch_sizes == [unique_count]
+    assert cached(positions, "white", profile) == expected
+    assert cached(positions[:5] + [Board()], "black", profile) == _evaluate_python(
+        positions[:5] + [Board()], "black", profile
+    )
+    assert len(batch_sizes) == 2
+
+
+def test_benchmark_c_evaluators_reuse_prebuilt_eval_arrays():
+    if not c_evaluator_available():
+        return
+
+    profile = next(entry for entry in get_ai_profiles() if entry["id"] == "d2_pawnwise_control")
+    positions = _sample_positions(20, 8, random.Random(5))
+    eval_arrays = benchmark_eval._profile_eval_arrays(profile)
+    expected = _evaluate_python(positions, "white", profile)
+
+    original_build = benchmark_eval._build_c_eval_arrays
+
+    def fail_build(*args, **kwargs):
+        raise AssertionError("eval arrays rebuilt despite being supplied")
+
+    benchmark_eval._build_c_eval_arrays = fail_build
+    try:
+        c_scores = benchmark_eval._evaluate_c(positions, "white", profile, eval_arrays)
+        batch_scores = benchmark_eval._evaluate_c_batch(positions, "white", profile, eval_arrays)
+    finally:
+        benchmark_eval._build_c_eval_arrays = original_build
+
+    for scores in (c_scores, batch_scores):
+        assert len(scores) == len(expected)
+        assert all(abs(score - expected_score) < 1e-9 for score, expected_score in zip(scores, expected))
+
+
+def _walk_slider_moves(board, piece, directions, include_own_blockers=False):
+    moves = set()
+    for col_step, row_step in directions:
+        col, row = piece.position[0] + col_step, piece.position[1] + row_step
+        while 0 <= col < 8 and 0 <= row < 8:
+            if include_own_blockers or piece.can_occupy(board, (col, row)):
+                moves.add((col, row))
+            if board.get_piece_at((col, row)) is not None:
+                break
+            col, row = col + col_step, row + row_step
+    return moves
+
+
+def test_slider_attack_tables_match_ray_walk():
+    straight = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    diagonal = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+    directions_by_class = {Rook: straight, Bishop: diagonal, Queen: straight + diagonal}
+    rng = random.Random(3)
+    board = Board()
+    current_turn = "white"
+    for _ in range(60):
+        for piece in board.pieces:
+            directions = directions_by_class.get(piece.__class__)
+            if directions is not None:
+                assert set(piece.get_legal_moves(board)) == _walk_slider_moves(board, piece, directions)
+                attacked = _walk_slider_moves(board, piece, directions, include_own_blockers=True)
+                for square in [(col, row) for row in range(8) for col in range(8)]:
+                    assert board.piece_attacks_square(piece, square) == (square in attacked)
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if not legal_moves or get_game_status(board, current_turn)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_piece_attacks_square_rejects_off_board_targets():
+    board = Board()
+    off_board = [(-1, 2), (8, 2), (2, -1), (2, 8), (8, 1), (-1, -1)]
+    for piece in board.pieces:
+        for square in off_board:
+            assert not board.piece_attacks_square(piece, square)
+
+
+def test_is_in_check_uses_attacker_bitboards():
+    board = _empty_board()
+    _place(board, King("white", (4, 0)))
+    _place(board, Bishop("black", (7, 3)))
+    assert board.is_in_check("white")
+
+    _place(board, Pawn("white", (5, 1)))
+    assert not board.is_in_check("white")
+
+    _place(board, Knight("black", (3, 2)))
+    assert board.is_in_check("white")
+    assert not board.is_in_check("black")
+
+    rng = random.Random(9)
+    board = Board()
+    current_turn = "white"
+    for _ in range(80):
+        for color in ("white", "black"):
+            king_position = board.find_king_position(color)
+            attackers = board.pieces_by_color[1 - COLOR_INDEX_BY_NAME[color]]
+            expected = king_position is not None and any(
+                board.piece_attacks_square(piece, king_position) for piece in attackers
+            )
+            assert board.is_in_check(color) == expected
+            assert expected == (
+                king_position is not None
+                and board.is_square_attacked(king_position, board.get_opponent_color(color))
+            )
+        for square in range(64):
+            for color_index in (0, 1):
+                assert board.is_attacked_by(square, color_index) == (board.attackers_to(square, color_index) != 0)
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if not legal_moves or get_game_status(board, current_turn)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_move_leaves_king_attacked_matches_cloned_board():
+    rng = random.Random(21)
+    for _ in range(6):
+        board = Board()
+        current_turn = "white"
+        for _ in range(50):
+            if get_game_status(board, current_turn)["state"] != "in_progress":
+                break
+            legal_moves = board.get_legal_moves_for_color(current_turn)
+            for from_pos, to_pos in legal_moves:
+                simulation = board.clone()
+                simulation.move_piece(from_pos, to_pos, update_tracking=False)
+                expected = simulation.is_in_check(current_turn)
+                assert board.move_leaves_king_attacked(current_turn, from_pos, to_pos) == expected
+            board.move_piece(*rng.choice(legal_moves))
+            current_turn = board.get_opponent_color(current_turn)
+
+
+def test_starting_position_copies_prototype_bitboards():
+    board = Board()
+    _assert_bitboards_match_pieces(board)
+    assert [(piece.symbol, piece.position) for piece in board.pieces[:9]] == [
+        ("R", (0, 0)), ("N", (1, 0)), ("B", (2, 0)), ("Q", (3, 0)), ("K", (4, 0)),
+        ("B", (5, 0)), ("N", (6, 0)), ("R", (7, 0)), ("P", (0, 1)),
+    ]
+
+    board.move_piece((4, 1), (4, 3))
+    assert Board().bitboards != board.bitboards
+    _assert_bitboards_match_pieces(Board())
+
+
+def test_clone_copies_slotted_pieces_independently():
+    board, _ = _replay_moves(["e2e4", "d7d5"])
+    assert not hasattr(board.pieces[0], "__dict__")
+
+    clone = board.clone()
+    clone_pawn = clone.get_piece_at((4, 3))
+    assert clone_pawn is not board.get_piece_at((4, 3))
+    assert clone.board[3 * 8 + 4] is clone_pawn and clone_pawn in clone.pieces
+
+    assert clone.pieces_by_color == [
+        [piece for piece in clone.pieces if piece.color == color] for color in ("white", "black")
+    ]
+    assert clone.position_counts == board.position_counts
+
+    clone.move_piece((4, 3), (3, 4))
+    assert clone.position_counts != board.position_counts
+    assert board.get_piece_at((4, 3)).position == (4, 3)
+    assert isinstance(board.get_piece_at((3, 4)), Pawn) and board.get_piece_at((3, 4)).color == "black"
+    _assert_bitboards_match_pieces(board)
+    _assert_bitboards_match_pieces(clone)
+
+
+def test_castling_rights_follow_home_square_kings_and_rooks():
+    assert Board().get_castling_rights() == "KQkq"
+
+    board, _ = _replay_moves(["h2h4", "a7a5", "h1h3", "e7e6", "h3h1", "e8e7"])
+    assert board.get_castling_rights() == "Q"
+
+    board = _empty_board()
+    assert board.get_castling_rights() == "-"
+    _place(board, King("white", (4, 0)))
+    _place(board, Queen("white", (7, 0)))
+    _place(board, Rook("white", (0, 0)))
+    _place(board, King("black", (4, 7)))
+    _place(board, Rook("white", (7, 7)))
+    _place(board, Rook("black", (0, 7)))
+    assert board.get_castling_rights() == "Qq"
+
+
+def test_bitboards_track_captures_castling_and_promotion():
+    board, _ = _replay_moves(["e2e4", "d7d5", "e4d5", "g8f6", "g1f3", "f6d5", "f1c4", "c7c6", "e1g1"])
+    _assert_bitboards_match_pieces(board)
+
+    promotion_board = _empty_board()
+    _place(promotion_board, Pawn("white", (4, 6)))
+    _place(promotion_board, Rook("black", (3, 7)))
+    apply_coordinate_move(promotion_board, "white", "e7d8n")
+    _assert_bitboards_match_pieces(promotion_board)
+
+
 def test_parse_coordinate_move():
     assert parse_coordinate_move("e2e4") == {
         "from_square": "e2",
@@ -176,6 +502,14 @@ def test_parse_coordinate_move():
         "promotion_piece": "q",
         "normalized": "e7e8q",
     }
+    assert parse_coordinate_move(" a2a1=N ")["normalized"] == "a2a1n"
+
+    for move_text in ("e2", "e2e", "e2e9", "i2e4", "e2e4k", "e2e4==q", "e2-e4", "e2e4qq"):
+        try:
+            parse_coordinate_move(move_text)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected {move_text!r} to be rejected")
 
 
 def test_parse_algebraic_move():
@@ -216,6 +550,60 @@ def test_parse_algebraic_move():
     }
 
 
+def test_parse_algebraic_move_scanner_edge_cases():
+    pawn_capture = parse_algebraic_move("exd8n+")
+    assert pawn_capture["from_file"] == "e"
+    assert pawn_capture["is_capture"] is True
+    assert pawn_capture["to_square"] == "d8"
+    assert pawn_capture["promotion_piece"] == "n"
+    assert pawn_capture["normalized"] == "exd8=N"
+
+    # A leading lowercase b is read as a bishop, as the piece letter is matched first.
+    assert parse_algebraic_move("bxc3")["piece_type"] == "bishop"
+    assert parse_algebraic_move("Qh4#!")["normalized"] == "Qh4"
+
+    for move_text in ("e9", "Nf", "xe4x", "e4=", "Pe4", "exx5", "e4e5e6"):
+        try:
+            parse_algebraic_move(move_text)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected {move_text!r} to be rejected")
+
+
+def test_square_names_round_trip_and_reject_bad_input():
+    for row in range(8):
+        for col in range(8):
+            assert square_to_position(position_to_square((col, row))) == (col, row)
+
+    for square in ("", "a", "i1", "a0", "a9", "A1", "e44", "1a"):
+        try:
+            square_to_position(square)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected {square!r} to be rejected")
+
+    assert position_to_square((0, 0)) == "a1" and position_to_square((7, 7)) == "h8"
+    for position in ((8, 0), (0, 8), (-1, 3)):
+        try:
+            position_to_square(position)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected {position!r} to be rejected")
+
+
+def test_board_str_renders_ranks_top_down():
+    board = Board()
+    board.move_piece((4, 1), (4, 3))
+    lines = str(board).split("\n")
+
+    assert len(lines) == 10
+    assert lines[0] == lines[-1] == "  a b c d e f g h"
+    assert lines[1] == "8 r n b q k b n r 8"
+    assert lines[4] == "5 . . . . . . . . 5"
+    assert lines[5] == "4 . . . . P . . . 4"
+    assert lines[7] == "2 P P P P . P P P 2"
+
+
 def test_apply_coordinate_move_from_starting_position():
     board = Board()
 
@@ -236,6 +624,31 @@ def test_apply_algebraic_move_from_starting_position():
     assert normalized_move == "e4"
 
 
+def test_apply_algebraic_move_resolves_candidates_by_piece_type_and_file():
+    board = _empty_board()
+    _place(board, King("white", (4, 0)))
+    _place(board, King("black", (4, 7)))
+    _place(board, Rook("white", (0, 0)))
+    _place(board, Rook("white", (0, 6)))
+    _place(board, Pawn("white", (2, 3)))
+    _place(board, Pawn("white", (4, 3)))
+    _place(board, Knight("black", (3, 4)))
+
+    try:
+        apply_algebraic_move(board.clone(), "white", "Ra4")
+    except ValueError as error:
+        assert "Ambiguous" in str(error)
+    else:
+        raise AssertionError("Expected ambiguous rook move to be rejected")
+
+    piece, to_position, normalized_move = apply_algebraic_move(board, "white", "exd5")
+    assert isinstance(piece, Pawn)
+    assert to_position == (3, 4)
+    assert normalized_move == "exd5"
+    assert board.get_piece_at((4, 3)) is None
+    assert isinstance(board.get_piece_at((2, 3)), Pawn)
+
+
 def test_apply_user_move_supports_both_notations():
     board = Board()
 
@@ -339,6 +752,34 @@ def test_en_passant_capture_is_available_immediately():
     assert board.get_piece_at((5, 4)) is None
 
 
+def test_en_passant_signature_only_counts_adjacent_capturing_pawns():
+    board, current_turn = _replay_moves(["e2e4", "a7a6", "e4e5", "f7f5"])
+    assert board.get_en_passant_square_for_signature(current_turn) == "f6"
+
+    board, current_turn = _replay_moves(["b2b3", "a7a5", "b3b4", "a5a4", "h2h4"])
+    assert board.en_passant_target == (7, 2)
+    assert board.get_en_passant_square_for_signature(current_turn) == "-"
+
+    board, current_turn = _replay_moves(["e2e4"])
+    assert board.get_en_passant_square_for_signature(current_turn) == "-"
+
+
+def test_pawn_moves_keep_push_then_capture_order_for_both_colors():
+    board = _empty_board()
+    _place(board, Pawn("black", (3, 6)))
+    _place(board, Pawn("white", (2, 5)))
+    _place(board, Pawn("white", (4, 5)))
+    _place(board, Knight("white", (3, 4)))
+    assert board.get_piece_at((3, 6)).get_legal_moves(board) == [(3, 5), (2, 5), (4, 5)]
+
+    board.remove_piece_at((3, 4))
+    assert board.get_piece_at((3, 6)).get_legal_moves(board) == [(3, 5), (3, 4), (2, 5), (4, 5)]
+
+    board, _ = _replay_moves(["h2h4", "a7a6", "h4h5", "g7g5"])
+    assert board.get_piece_at((7, 4)).get_legal_moves(board) == [(7, 5), (6, 5)]
+    assert board.get_piece_at((6, 4)).get_legal_moves(board) == [(6, 3)]
+
+
 def test_en_passant_expires_after_one_turn():
     board, current_turn = _replay_moves(["e2e4", "a7a6", "e4e5", "f7f5", "a2a3", "a6a5"])
     assert current_turn == "white"
@@ -405,6 +846,17 @@ def test_threefold_repetition_draw_status():
     assert status == {"state": "draw", "reason": "threefold_repetition", "winner": None}
 
 
+def test_placement_key_matches_transpositions():
+    start_key = Board().get_placement_key()
+    board, _ = _replay_moves(["g1f3", "g8f6", "f3g1", "f6g8"])
+    assert board.get_placement_key() == start_key
+
+    first_order, _ = _replay_moves(["e2e4", "e7e5", "g1f3"])
+    second_order, _ = _replay_moves(["g1f3", "e7e5", "e2e4"])
+    assert first_order.get_placement_key() == second_order.get_placement_key()
+    assert first_order.get_placement_key() != start_key
+
+
 def test_fifty_move_rule_draw_status():
     board = Board()
     board.halfmove_clock = 100
@@ -413,6 +865,71 @@ def test_fifty_move_rule_draw_status():
     assert status == {"state": "draw", "reason": "fifty_move_rule", "winner": None}
 
 
+def test_has_legal_move_matches_generated_moves():
+    board = _empty_board()
+    _place(board, King("white", (0, 0)))
+    _place(board, King("black", (7, 7)))
+    for row in range(8):
+        _place(board, Pawn("white", (1, row)))
+        if row:
+            _place(board, Pawn("white", (0, row)))
+    assert not board.has_legal_move("white")
+    assert board.get_legal_moves_for_color("white") == []
+
+    rng = random.Random(21)
+    board = Board()
+    current_turn = "white"
+    for _ in range(60):
+        for color in ("white", "black"):
+            assert board.has_legal_move(color) == bool(board.get_legal_moves_for_color(color))
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if get_game_status(board, current_turn, legal_moves=legal_moves)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_move_bitboards_match_generated_moves():
+    rng = random.Random(5)
+    board = Board()
+    current_turn = "white"
+    for _ in range(80):
+        for piece in board.pieces:
+            expected_bits = 0
+            for col, row in piece.get_legal_moves(board):
+                expected_bits |= 1 << (row * 8 + col)
+            assert piece.get_move_bitboard(board) == expected_bits, (piece, board.en_passant_target)
+        legal_moves = board.get_legal_moves_for_color(current_turn)
+        if get_game_status(board, current_turn, legal_moves=legal_moves)["state"] != "in_progress":
+            break
+        board.move_piece(*rng.choice(legal_moves))
+        current_turn = board.get_opponent_color(current_turn)
+
+
+def test_is_legal_move_rejects_off_board_targets():
+    board = Board()
+    assert board.is_legal_move("white", (1, 0), (2, 2))
+    # (8, 1) would wrap onto a3 and (4, -1) would be a negative shift as square indexes.
+    assert not board.is_legal_move("white", (1, 0), (8, 1))
+    assert not board.is_legal_move("white", (4, 1), (4, -1))
+    assert not board.is_legal_move("white", (0, 0), (-1, 0))
+
+
+def test_game_status_uses_supplied_legal_moves():
+    board = Board()
+    legal_moves = board.get_legal_moves_for_color("white")
+    assert get_game_status(board, "white", legal_moves=legal_moves) == get_game_status(board, "white")
+    assert get_game_status(board, "white", legal_moves=[]) == {
+        "state": "draw",
+        "reason": "stalemate",
+        "winner": None,
+    }
+
+    board.halfmove_clock = 100
+    status = get_game_status(board, "white", legal_moves=[])
+    assert status == {"state": "draw", "reason": "fifty_move_rule", "winner": None}
+
+
 def test_king_capture_ends_game():
     board = _empty_board()
     _place(board, King("white", (0, 0)))
@@ -424,6 +941,22 @@ def test_king_capture_ends_game():
     assert status == {"state": "king_capture", "reason": "king_captured", "winner": "white"}
 
 
+def test_find_king_position_follows_king_moves_and_capture():
+    board = _empty_board()
+    _place(board, King("white", (4, 0)))
+    _place(board, Rook("white", (7, 0)))
+    _place(board, King("black", (4, 1)))
+    assert board.find_king_position("white") == (4, 0)
+
+    apply_coordinate_move(board, "white", "e1g1")
+    assert board.find_king_position("white") == (6, 0)
+
+    apply_coordinate_move(board, "black", "e2f1")
+    apply_coordinate_move(board, "white", "g1f1")
+    assert board.find_king_position("black") is None
+    assert board.find_king_position("white") == (5, 0)
+
+
 def test_choose_random_legal_move_returns_legal_move():
     board = Board()
     legal_moves = set(board.get_legal_moves_for_color("white"))
@@ -531,6 +1064,22 @@ def test_pawnwise_profile_heuristics_affect_evaluation():
     assert pawnwise_score != classic_score
 
 
+def test_opposite_color_bishops_reads_bishop_bitboards():
+    board = _empty_board()
+    _place(board, King("white", (4, 0)))
+    _place(board, King("black", (4, 7)))
+    _place(board, Bishop("white", (2, 0)))
+    _place(board, Bishop("black", (2, 7)))
+    assert _has_opposite_color_bishops(board)
+
+    board.remove_piece_at((2, 7))
+    _place(board, Bishop("black", (5, 7)))
+    assert not _has_opposite_color_bishops(board)
+
+    _place(board, Bishop("white", (5, 0)))
+    assert not _has_opposite_color_bishops(board)
+
+
 def test_pawnwise_control_profile_drawish_opposite_bishops():
     board = _empty_board()
     _place(board, Bishop("white", (2, 0)))
@@ -740,6 +1289,21 @@ def test_savefile_records_moves():
     assert lines[9] == "1. e4 e5 1/2-1/2"
 
 
+def test_start_savefile_returns_each_header_byte_offset():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        savefile_path = f"{temp_dir}/moves.pgn"
+        first_offset = start_savefile(savefile_path)
+        record_move(savefile_path, 1, "white", "e4")
+        second_offset = start_savefile(savefile_path)
+
+        with open(savefile_path, "rb") as savefile:
+            content = savefile.read()
+
+    assert first_offset == 0
+    assert second_offset == content.rindex(b"[Event ")
+    assert content[:second_offset].endswith(b"1. e4 \n")
+
+
 def test_apply_user_move_records_with_attached_savefile_recorder():
     with tempfile.TemporaryDirectory() as temp_dir:
         savefile_path = f"{temp_dir}/moves.pgn"
@@ -749,8 +1313,16 @@ def test_apply_user_move_records_with_attached_savefile_recorder():
         set_savefile_recorder(board, savefile_recorder)
 
         apply_user_move(board, "white", "e4")
+        # Moves reach the file as they are played, before the game is finalized.
+        with open(savefile_path, "r", encoding="utf-8") as savefile:
+            assert savefile.read().endswith("\n\n1. e4 ")
+        # Search clones must not carry the open recorder along.
+        simulation = board.clone()
+        assert not hasattr(simulation, "savefile_recorder")
+        apply_user_move(simulation, "black", "c5")
         apply_user_move(board, "black", "e5")
         savefile_recorder.finalize({"state": "draw", "reason": "stalemate", "winner": None})
+        assert savefile_recorder.savefile is None
 
         with open(savefile_path, "r", encoding="utf-8") as savefile:
             lines = [line.rstrip("\n") for line in savefile]
@@ -758,6 +1330,75 @@ def test_apply_user_move_records_with_attached_savefile_recorder():
     assert lines[9] == "1. e4 e5 1/2-1/2"
 
 
+def test_savefile_recorder_finalizes_each_game_in_a_shared_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        savefile_path = f"{temp_dir}/moves.pgn"
+        savefile_recorder = SavefileRecorder(savefile_path)
+        savefile_recorder.record_algebraic_move("white", "e4")
+        savefile_recorder.finalize({"state": "king_capture", "reason": "king_captured", "winner": "white"})
+        savefile_recorder.prepare_new_game()
+        savefile_recorder.record_algebraic_move("white", "d4")
+        savefile_recorder.record_algebraic_move("black", "d5")
+        savefile_recorder.finalize({"state": "draw", "reason": "stalemate", "winner": None})
+
+        with open(savefile_path, "r", encoding="utf-8") as savefile:
+            content = savefile.read()
+
+    games = content.split("\n\n[Event ")
+    assert len(games) == 2
+    assert "[Result \"1-0\"]" in games[0] and games[0].endswith("1. e4 1-0\n")
+    assert "[Result \"1/2-1/2\"]" in games[1] and games[1].endswith("1. d4 d5 1/2-1/2\n\n")
+    assert "[Result \"*\"]" not in content
+
+
+def test_boards_with_started_savefile_recorder_can_be_copied():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        savefile_path = f"{temp_dir}/moves.pgn"
+        board = Board()
+        savefile_recorder = SavefileRecorder(savefile_path)
+        set_savefile_recorder(board, savefile_recorder)
+        apply_user_move(board, "white", "e4")
+        assert savefile_recorder.savefile is not None
+
+        assert board.clone().get_piece_at((4, 3)) is not None
+        board_copy = copy.deepcopy(board)
+        copied_recorder = board_copy.savefile_recorder
+        assert copied_recorder is not savefile_recorder and copied_recorder.savefile is None
+        assert savefile_recorder.savefile is not None
+
+        # The copy reopens the same savefile rather than sharing the original handle.
+        apply_user_move(board_copy, "black", "e5")
+        copied_recorder.close()
+        savefile_recorder.close()
+        with open(savefile_path, "r", encoding="utf-8") as savefile:
+            assert savefile.read().endswith("\n\n1. e4 e5 ")
+
+
+def test_uci_multipv_verbose_search_after_recorded_moves():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        uci_input = (
+            "uci\n"
+            "isready\n"
+            "setoption name MultiPV value 3\n"
+            "setoption name InfoMode value verbose\n"
+            "position startpos moves e2e4\n"
+            "go depth 2\n"
+            "quit\n"
+        )
+        completed = subprocess.run(
+            ["python3", "chess_uci.py", "d2_pawnwise_control"],
+            input=uci_input,
+            text=True,
+            capture_output=True,
+            check=True,
+            env={**os.environ, "CHESS_UCI_SAVEFILE": f"{temp_dir}/uci.pgn"},
+        )
+
+    output_lines = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
+    assert any(line.startswith("bestmove ") for line in output_lines)
+    assert "Traceback" not in completed.stderr
+
+
 def test_parse_uci_position_record_from_move_index_skips_existing_moves():
     with tempfile.TemporaryDirectory() as temp_dir:
         savefile_path = f"{temp_dir}/moves.pgn"
@@ -872,6 +1513,64 @@ def test_c_piece_evaluation_matches_python_when_available():
     assert abs(c_scores[1] - python_scores[1]) < 1e-9
 
 
+def test_c_batch_evaluation_matches_single_board_calls():
+    if not c_evaluator_available():
+        return
+
+    profiles = get_ai_profiles()
+    profile = next(profile for profile in profiles if profile["id"] == "d2_pawnwise_control")
+    boards = [
+        Board(),
+        _replay_moves(["e2e4", "d7d5", "e4d5", "g8f6", "d2d4", "f6d5"])[0],
+        _empty_board(),
+        _replay_moves(["g1f3", "b8c6", "f3e5", "c6e5"])[0],
+    ]
+
+    batch_scores = _evaluate_positions_scores_c_batch(
+        boards,
+        "black",
+        profile["piece_values"],
+        pawn_rank_values=profile.get("pawn_rank_values"),
+        backward_pawn_value=profile.get("backward_pawn_value"),
+        position_multipliers=profile.get("position_multipliers"),
+    )
+
+    assert len(batch_scores) == len(boards)
+    for board, (material_score, heuristic_score) in zip(boards, batch_scores):
+        single_scores = _evaluate_position_scores_c_base(
+            board,
+            "black",
+            profile["piece_values"],
+            pawn_rank_values=profile.get("pawn_rank_values"),
+            backward_pawn_value=profile.get("backward_pawn_value"),
+            position_multipliers=profile.get("position_multipliers"),
+        )
+        assert abs(material_score - single_scores[0]) < 1e-9
+        assert abs(heuristic_score - single_scores[1]) < 1e-9
+
+
+def test_square_weight_tables_match_per_square_weights():
+    profiles = get_ai_profiles()
+    profile = next(profile for profile in profiles if profile["id"] == "d2_pawnwise_control")
+    position_multipliers = profile["position_multipliers"]
+
+    tables = _square_weight_tables(position_multipliers)
+    assert _square_weight_tables(position_multipliers) is tables
+    for type_index, piece_type in enumerate(["pawn", "knight", "bishop", "rook", "queen", "king"]):
+        for row in range(8):
+            for col in range(8):
+                expected = _square_weight(piece_type == "rook", (col, row), position_multipliers)
+                assert tables[type_index][row * 8 + col] == expected
+
+    # Tables follow the multipliers' contents, not the dict's identity.
+    edited_multipliers = dict(position_multipliers)
+    assert _square_weight_tables(edited_multipliers) is tables
+    edited_multipliers["center"] = position_multipliers.get("center", 1.0) + 1.0
+    edited_tables = _square_weight_tables(edited_multipliers)
+    assert edited_tables[1][3 * 8 + 3] == edited_multipliers["center"]
+    assert _square_weight_tables(position_multipliers) is tables
+
+
 def test_c_search_returns_legal_move_when_available():
     if not c_search_available():
         return
@@ -923,6 +1622,47 @@ def test_pawnwise_fen_prefers_kg1_or_g2_for_shallow_depths():
         )
 
 
+def test_c_search_pruning_keeps_minimax_choice():
+    if not c_search_available():
+        return
+
+    profile = next(profile for profile in get_ai_profiles() if profile["id"] == "d2_pawnwise_control")
+    eval_kwargs = {
+        "pawn_rank_values": profile.get("pawn_rank_values"),
+        "backward_pawn_value": profile.get("backward_pawn_value"),
+        "position_multipliers": profile.get("position_multipliers"),
+        "control_weight": profile.get("control_weight", 0.0),
+        "opposite_bishop_draw_factor": profile.get("opposite_bishop_draw_factor"),
+    }
+    rng = random.Random(17)
+    board = Board()
+    current_turn = "white"
+    for ply in range(24):
+        if get_game_status(board, current_turn)["state"] != "in_progress":
+            break
+        if ply % 6 == 5:
+            # Alpha-beta may cut the search short, but the chosen move must still score
+            # as well as the best move of a full-width search.
+            move = choose_minimax_legal_move(board, current_turn, 2, profile["piece_values"], **eval_kwargs)
+            scores = {}
+            for from_pos, to_pos in board.get_legal_moves_for_color(current_turn):
+                simulation = board.clone()
+                simulation.move_piece(from_pos, to_pos)
+                scores[(from_pos, to_pos)] = minimax_score(
+                    simulation,
+                    board.get_opponent_color(current_turn),
+                    current_turn,
+                    1,
+                    profile["piece_values"],
+                    **eval_kwargs,
+                )
+            best_material, best_heuristic = max(scores.values())
+            material, heuristic = scores[move]
+            assert material == best_material and abs(heuristic - best_heuristic) < 1e-9
+        board.move_piece(*rng.choice(board.get_legal_moves_for_color(current_turn)))
+        current_turn = board.get_opponent_color(current_turn)
+
+
 def test_c_search_cache_handle_reused_across_turns():
     if not c_search_available():
         return
@@ -1197,10 +1937,28 @@ def run_all_tests():
         test_position_move_counts,
         test_rook_path_obstruction_and_capture,
         test_pawn_forward_and_diagonal_captures,
+        test_knight_and_king_moves_use_attack_tables,
+        test_step_moves_keep_offset_order,
+        test_slider_moves_keep_ray_order,
+        test_benchmark_sampling_matches_baseline_move_order,
+        test_benchmark_eval_cache_batches_misses_per_pass,
+        test_benchmark_c_evaluators_reuse_prebuilt_eval_arrays,
+        test_slider_attack_tables_match_ray_walk,
+        test_piece_attacks_square_rejects_off_board_targets,
+        test_is_in_check_uses_attacker_bitboards,
+        test_move_leaves_king_attacked_matches_cloned_board,
+        test_starting_position_copies_prototype_bitboards,
+        test_clone_copies_slotted_pieces_independently,
+        test_castling_rights_follow_home_square_kings_and_rooks,
+        test_bitboards_track_captures_castling_and_promotion,
         test_parse_coordinate_move,
         test_parse_algebraic_move,
+        test_parse_algebraic_move_scanner_edge_cases,
+        test_square_names_round_trip_and_reject_bad_input,
+        test_board_str_renders_ranks_top_down,
         test_apply_coordinate_move_from_starting_position,
         test_apply_algebraic_move_from_starting_position,
+        test_apply_algebraic_move_resolves_candidates_by_piece_type_and_file,
         test_apply_user_move_supports_both_notations,
         test_apply_coordinate_move_promotes_pawn,
         test_apply_algebraic_move_promotes_pawn,
@@ -1209,12 +1967,20 @@ def run_all_tests():
         test_apply_coordinate_move_allows_capture,
         test_last_game_scenario_attempted_moves,
         test_en_passant_capture_is_available_immediately,
+        test_en_passant_signature_only_counts_adjacent_capturing_pawns,
+        test_pawn_moves_keep_push_then_capture_order_for_both_colors,
         test_en_passant_expires_after_one_turn,
         test_castling_kingside_and_queenside,
         test_castling_allowed_even_when_path_square_is_attacked,
         test_threefold_repetition_draw_status,
+        test_placement_key_matches_transpositions,
         test_fifty_move_rule_draw_status,
+        test_has_legal_move_matches_generated_moves,
+        test_move_bitboards_match_generated_moves,
+        test_is_legal_move_rejects_off_board_targets,
+        test_game_status_uses_supplied_legal_moves,
         test_king_capture_ends_game,
+        test_find_king_position_follows_king_moves_and_capture,
         test_choose_random_legal_move_returns_legal_move,
         test_apply_random_ai_move_executes_selected_legal_move,
         test_apply_random_ai_move_fails_without_legal_moves,
@@ -1223,6 +1989,7 @@ def run_all_tests():
         test_configure_game_menu_quit_option,
         test_play_match_ai_vs_ai_returns_terminal_status,
         test_pawnwise_profile_heuristics_affect_evaluation,
+        test_opposite_color_bishops_reads_bishop_bitboards,
         test_pawnwise_control_profile_drawish_opposite_bishops,
         test_position_heuristics_are_tie_breakers_for_major_pieces,
         test_minimax_prefers_material_over_heuristic,
@@ -1231,7 +1998,11 @@ def run_all_tests():
         test_tournament_tiebreaker_prefers_head_to_head_for_champion_tie,
         test_tournament_writes_results_and_scoreboard,
         test_savefile_records_moves,
+        test_start_savefile_returns_each_header_byte_offset,
         test_apply_user_move_records_with_attached_savefile_recorder,
+        test_savefile_recorder_finalizes_each_game_in_a_shared_file,
+        test_boards_with_started_savefile_recorder_can_be_copied,
+        test_uci_multipv_verbose_search_after_recorded_moves,
         test_parse_uci_position_record_from_move_index_skips_existing_moves,
         test_convert_legacy_save_text_to_pgn,
         test_move_text_to_algebraic_converts_coordinate_notation,
@@ -1240,8 +2011,11 @@ def run_all_tests():
         test_move_text_to_algebraic_disambiguates_queen_by_file_and_rank,
         test_move_text_to_algebraic_uses_pawn_file_on_capture,
         test_c_piece_evaluation_matches_python_when_available,
+        test_c_batch_evaluation_matches_single_board_calls,
+        test_square_weight_tables_match_per_square_weights,
         test_c_search_returns_legal_move_when_available,
         test_pawnwise_fen_prefers_kg1_or_g2_for_shallow_depths,
+        test_c_search_pruning_keeps_minimax_choice,
         test_c_search_cache_handle_reused_across_turns,
         test_parse_uci_position_startpos_with_moves_tracks_turn,
         test_uci_go_reports_score_info_line,